@@ -32,23 +32,30 @@ def main() -> None:
         install_packages_nogui("whiptail")
 
     choice: Optional[str] = None
-    while True:
-        choice = main_menu(choice)
-
-        if choice == "satellite":
-            configure_satellite(settings)
-        elif choice == "microphone":
-            configure_microphone(settings)
-        elif choice == "speakers":
-            configure_speakers(settings)
-        elif choice == "wake":
-            configure_wake_word(settings)
-        elif choice == "drivers":
-            install_drivers(settings)
-        elif choice == "apply":
-            apply_settings(settings)
-        else:
-            break
+    try:
+        while True:
+            choice = main_menu(choice)
+
+            if choice == "satellite":
+                configure_satellite(settings)
+            elif choice == "microphone":
+                configure_microphone(settings)
+            elif choice == "speakers":
+                configure_speakers(settings)
+            elif choice == "wake":
+                configure_wake_word(settings)
+            elif choice == "drivers":
+                install_drivers(settings)
+            elif choice == "apply":
+                apply_settings(settings)
+            else:
+                break
+
+            # Changes are batched until we're back at the main menu
+            settings.save_if_dirty()
+    finally:
+        # Keep changes made in a submenu if it was interrupted (Ctrl-C, etc.)
+        settings.save_if_dirty()
 
 
 def main_menu(last_choice: Optional[str]) -> Optional[str]:
@@ -72,15 +79,18 @@ def main_menu(last_choice: Optional[str]) -> Optional[str]:
 # -----------------------------------------------------------------------------
 
 
+_PIP_INSTALL = [
+    str(PROGRAM_DIR / ".venv" / "bin" / "pip3"),
+    "install",
+    "--extra-index-url",
+    "https://www.piwheels.org/simple",
+    "-f",
+    "https://synesthesiam.github.io/prebuilt-apps/",
+]
+
+
 def pip_install(*args) -> List[str]:
-    return [
-        str(PROGRAM_DIR / ".venv" / "bin" / "pip3"),
-        "install",
-        "--extra-index-url",
-        "https://www.piwheels.org/simple",
-        "-f",
-        "https://synesthesiam.github.io/prebuilt-apps/",
-    ] + list(args)
+    return [*_PIP_INSTALL, *args]
 
 
 def apply_settings(settings: Settings) -> None:
@@ -1,13 +1,21 @@
 """Constants and dataclasses."""
+import copy
 import json
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .dataclasses_json import DataClassJsonMixin
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 _DIR = Path(__file__).parent
 _LOGGER = logging.getLogger()
 
@@ -16,8 +24,9 @@ LOCAL_DIR = PROGRAM_DIR / "local"
 SETTINGS_PATH = LOCAL_DIR / "settings.json"
 SERVICES_DIR = LOCAL_DIR / "services"
 
-RECORD_SECONDS = 5
+RECORD_SECONDS = 3
 RECORD_RMS_MIN = 30
+RECORD_RMS_LOUD = 3 * RECORD_RMS_MIN  # autodetect stops early above this
 
 TITLE = "Wyoming Satellite"
 WIDTH = "75"
@@ -94,21 +103,81 @@ class Settings(DataClassJsonMixin):
     snd: SpeakerSettings = field(default_factory=SpeakerSettings)
     wake: WakeWordSettings = field(default_factory=WakeWordSettings)
 
+    # True if settings have changed since the last save
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)
+
+    # JSON from the last load/save, used to skip writing unchanged settings
+    _last_json: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @staticmethod
     def load() -> "Settings":
-        if SETTINGS_PATH.exists():
-            _LOGGER.debug("Loading settings from %s", SETTINGS_PATH)
-            with open(SETTINGS_PATH, "r", encoding="utf-8") as settings_file:
-                settings_dict = json.load(settings_file)
-                return Settings.from_dict(settings_dict)
-
-        return Settings()
+        global _SETTINGS_CACHE
+
+        try:
+            settings_stat = SETTINGS_PATH.stat()
+        except FileNotFoundError:
+            return Settings()
+
+        cache_key = (
+            str(SETTINGS_PATH),
+            settings_stat.st_mtime_ns,
+            settings_stat.st_size,
+        )
+        if (_SETTINGS_CACHE is not None) and (_SETTINGS_CACHE[0] == cache_key):
+            # Copy so callers can't modify the cached settings
+            return copy.deepcopy(_SETTINGS_CACHE[1])
+
+        _LOGGER.debug("Loading settings from %s", SETTINGS_PATH)
+        settings_json = SETTINGS_PATH.read_bytes()
+        settings = Settings.from_dict(_loads(settings_json))
+        settings._last_json = settings_json
+        _SETTINGS_CACHE = (cache_key, copy.deepcopy(settings))
+        return settings
 
     def save(self) -> None:
         _LOGGER.debug("Saving settings to %s", SETTINGS_PATH)
 
-        settings_dict = self.to_dict()
+        self._dirty = False
+        settings_json = _dumps(self)
+        if settings_json == self._last_json:
+            _LOGGER.debug("Settings are unchanged")
+            return
+
+        global _SETTINGS_CACHE
+        _SETTINGS_CACHE = None
+
         SETTINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        SETTINGS_PATH.write_bytes(settings_json)
+        self._last_json = settings_json
+
+    def mark_dirty(self) -> None:
+        """Mark settings as changed so they are written by save_if_dirty."""
+        self._dirty = True
+
+    def save_if_dirty(self) -> None:
+        """Save settings only if they have changed."""
+        if self._dirty:
+            self.save()
+
+
+# (path, mtime_ns, size) -> settings from the last load
+_SETTINGS_CACHE: Optional[Tuple[Tuple[str, int, int], Settings]] = None
+
+
+def _loads(data: bytes) -> Dict[str, Any]:
+    """Parse settings JSON, using orjson if available."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def _dumps(settings: Settings) -> bytes:
+    """Serialize settings to indented JSON, using orjson if available."""
+    if _HAS_ORJSON:
+        # orjson serializes dataclasses and enums directly
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2)
 
-        with open(SETTINGS_PATH, "w", encoding="utf-8") as settings_file:
-            json.dump(settings_dict, settings_file, ensure_ascii=False, indent=2)
+    return json.dumps(settings.to_dict(), ensure_ascii=False, indent=2).encode("utf-8")
@@ -1,6 +1,7 @@
 """Implement a tiny subset of dataclasses_json for config."""
 from collections.abc import Mapping, Sequence
-from dataclasses import asdict, fields, is_dataclass
+from dataclasses import fields, is_dataclass
+from enum import Enum
 from typing import Any, Dict, Type
 
 
@@ -12,7 +13,8 @@ class DataClassJsonMixin:
         """Parse dataclasses recursively."""
         kwargs: Dict[str, Any] = {}
 
-        cls_fields = {field.name: field for field in fields(cls)}
+        # Fields not passed to __init__ are internal state, not settings
+        cls_fields = {field.name: field for field in fields(cls) if field.init}
         for key, value in data.items():
             if key not in cls_fields:
                 # Skip unknown fields
@@ -33,8 +35,34 @@ class DataClassJsonMixin:
         return cls(**kwargs)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Alias for asdict."""
-        return asdict(self)
+        """Convert to JSON-ready dict without asdict's deep copies.
+
+        Private fields (leading underscore) are skipped, like orjson does.
+        """
+        return {
+            field.name: _encode(getattr(self, field.name))
+            for field in fields(self)
+            if not field.name.startswith("_")
+        }
+
+
+def _encode(value: Any) -> Any:
+    """Encode value for JSON."""
+    if isinstance(value, DataClassJsonMixin):
+        return value.to_dict()
+
+    if isinstance(value, Enum):
+        return value.value
+
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+
+    if isinstance(value, dict):
+        return {
+            _encode(map_key): _encode(map_value) for map_key, map_value in value.items()
+        }
+
+    return value
 
 
 def _decode(value: Any, target_type: Type) -> Any:
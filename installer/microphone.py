@@ -1,18 +1,35 @@
 """Microphone settings."""
 import array
+import asyncio
+import functools
 import logging
 import math
+import operator
 import subprocess
-from concurrent.futures import Future, ThreadPoolExecutor
-from typing import Dict, List, Optional
+from typing import List, Optional, Tuple
 
-from .const import RECORD_RMS_MIN, RECORD_SECONDS, Settings
-from .whiptail import gauge, inputbox, menu, msgbox, radiolist
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    # Installer may run on a system Python without numpy
+    _HAS_NUMPY = False
+
+from .const import RECORD_RMS_LOUD, RECORD_RMS_MIN, RECORD_SECONDS, Settings
+from .whiptail import Gauge, inputbox, menu, msgbox, radiolist
 
 _LOGGER = logging.getLogger()
 
+# 16Khz 16-bit mono
+_RECORD_CHUNK_BYTES = 16000 * 2 // 4  # 250 ms
+_RECORD_LOUD_MIN_SAMPLES = 16000  # 1 second
+
 
 def configure_microphone(settings: Settings) -> None:
+    # Devices are listed once per visit to this menu
+    invalidate_device_cache()
+
     choice: Optional[str] = None
     while True:
         choice = microphone_menu(choice)
@@ -23,35 +40,29 @@ def configure_microphone(settings: Settings) -> None:
             best_rms: Optional[float] = None
 
             devices = get_microphone_devices()
-            with ThreadPoolExecutor() as executor:
-                futures: Dict[str, Future] = {}
-                for device in devices:
-                    futures[device] = executor.submit(_record_proc, device)
-
-                gauge("Speak loudly into the microphone.", RECORD_SECONDS)
-                for device, future in futures.items():
-                    device_rms = future.result()
-                    if device_rms is None:
-                        _LOGGER.warning("Failed to record from microphone %s", device)
-                        continue
-
-                    _LOGGER.debug(
-                        "Microphone %s got RMS %s (min: %s)",
-                        device,
-                        device_rms,
-                        RECORD_RMS_MIN,
-                    )
-                    if device_rms < RECORD_RMS_MIN:
-                        continue
-
-                    if (best_rms is None) or (device_rms > best_rms):
-                        best_device = device
-                        best_rms = device_rms
+            devices_rms = asyncio.run(_autodetect(devices))
+            for device, device_rms in zip(devices, devices_rms):
+                if device_rms is None:
+                    _LOGGER.warning("Failed to record from microphone %s", device)
+                    continue
+
+                _LOGGER.debug(
+                    "Microphone %s got RMS %s (min: %s)",
+                    device,
+                    device_rms,
+                    RECORD_RMS_MIN,
+                )
+                if device_rms < RECORD_RMS_MIN:
+                    continue
+
+                if (best_rms is None) or (device_rms > best_rms):
+                    best_device = device
+                    best_rms = device_rms
 
             if best_device is not None:
                 msgbox(f"Successfully detected microphone: {best_device}")
                 settings.mic.device = best_device
-                settings.save()
+                settings.mark_dirty()
             else:
                 msgbox(
                     "Audio was not detected from any microphone.\n"
@@ -64,12 +75,12 @@ def configure_microphone(settings: Settings) -> None:
             )
             if microphone_device:
                 settings.mic.device = microphone_device
-                settings.save()
+                settings.mark_dirty()
         elif choice == "manual":
             microphone_device = inputbox("Enter ALSA Device:", settings.mic.device)
             if microphone_device:
                 settings.mic.device = microphone_device
-                settings.save()
+                settings.mark_dirty()
         elif choice == "settings":
             configure_audio_settings(settings)
         else:
@@ -91,59 +102,135 @@ def microphone_menu(last_choice: Optional[str]) -> Optional[str]:
 
 
 def get_microphone_devices() -> List[str]:
+    """Return ALSA devices from arecord -L (cached until invalidate_device_cache)."""
+    return list(_list_microphone_devices())
+
+
+def invalidate_device_cache() -> None:
+    """Re-list devices on the next call to get_microphone_devices."""
+    _list_microphone_devices.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _list_microphone_devices() -> Tuple[str, ...]:
     devices = []
-    lines = subprocess.check_output(["arecord", "-L"]).decode("utf-8").splitlines()
-    for line in lines:
+    output = subprocess.check_output(
+        ["arecord", "-L"], stdin=subprocess.DEVNULL, close_fds=False
+    )
+
+    # Only decode the lines that are kept
+    for line in output.splitlines():
         line = line.strip()
 
         # default = PulseAudio
-        if (line == "default") or line.startswith("plughw:"):
-            devices.append(line)
+        if (line == b"default") or line.startswith(b"plughw:"):
+            devices.append(line.decode("utf-8"))
+
+    return tuple(devices)
 
-    return devices
 
+async def _autodetect(devices: List[str]) -> List[Optional[float]]:
+    """Record from all devices concurrently while the gauge is shown.
+
+    Recording stops early for all devices once one of them is clearly loud.
+    """
+    loud_event = asyncio.Event()
+    with Gauge("Speak loudly into the microphone.") as progress:
+        gauge_task = asyncio.create_task(_update_gauge(progress, RECORD_SECONDS))
+        try:
+            return await asyncio.gather(
+                *(_record_proc(device, loud_event) for device in devices)
+            )
+        finally:
+            gauge_task.cancel()
 
-def _record_proc(device: str) -> Optional[float]:
+
+async def _update_gauge(progress: Gauge, seconds: float, parts: int = 20) -> None:
+    # Sleep until absolute deadlines so updates don't drift
+    loop = asyncio.get_running_loop()
+    tick_seconds = seconds / parts
+    next_tick = loop.time()
+    step = max(1, 100 // parts)
+    for percent in range(step, 101, step):
+        next_tick += tick_seconds
+        await asyncio.sleep(max(0.0, next_tick - loop.time()))
+        progress.update(percent)
+
+
+async def _record_proc(device: str, loud_event: asyncio.Event) -> Optional[float]:
     try:
-        proc = subprocess.Popen(
-            [
-                "arecord",
-                "-q",
-                "-D",
-                device,
-                "-r",
-                "16000",
-                "-c",
-                "1",
-                "-f",
-                "S16_LE",
-                "-t",
-                "raw",
-                "-d",
-                str(RECORD_SECONDS),
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+        proc = await asyncio.create_subprocess_exec(
+            "arecord",
+            "-q",
+            "-D",
+            device,
+            "-r",
+            "16000",
+            "-c",
+            "1",
+            "-f",
+            "S16_LE",
+            "-t",
+            "raw",
+            "-d",
+            str(RECORD_SECONDS),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False,  # allows posix_spawn
         )
-        audio, stderr = proc.communicate()
-        if proc.returncode != 0:
+        assert proc.stdout is not None
+
+        # RMS is computed as audio arrives, so recording can stop early
+        sum_squares = 0
+        num_samples = 0
+        stopped_early = False
+        while True:
+            if loud_event.is_set():
+                stopped_early = True
+                break
+
+            try:
+                audio = await proc.stdout.readexactly(_RECORD_CHUNK_BYTES)
+            except asyncio.IncompleteReadError as err:
+                # End of recording
+                audio = err.partial[: len(err.partial) - (len(err.partial) % 2)]
+                if not audio:
+                    break
+
+            # 16-bit mono
+            sum_squares += _sum_squares(audio)
+            num_samples += len(audio) // 2
+
+            if (num_samples >= _RECORD_LOUD_MIN_SAMPLES) and (
+                math.sqrt(sum_squares / num_samples) >= RECORD_RMS_LOUD
+            ):
+                # Clearly loud, so stop recording from all devices
+                loud_event.set()
+
+        if stopped_early and (proc.returncode is None):
+            try:
+                proc.terminate()
+            except ProcessLookupError:
+                # Finished recording but not reaped yet
+                pass
+
+        _stdout, stderr = await proc.communicate()
+        if (proc.returncode != 0) and (not stopped_early):
             _LOGGER.error(
                 "Error recording from device %s: %s", device, stderr.decode("utf-8")
             )
             return None
 
-        # 16-bit mono
-        audio_array = array.array("h", audio)
-        rms = math.sqrt(
-            (1 / len(audio_array) * sum(x * x for x in audio_array.tolist()))
-        )
-        return rms
+        if num_samples < 1:
+            _LOGGER.error("No audio recorded from device: %s", device)
+            return None
+
+        return math.sqrt(sum_squares / num_samples)
     except Exception:
         _LOGGER.exception("Error recording from device: %s", device)
         return None
 
-    return 0
-
 
 def configure_audio_settings(settings: Settings) -> None:
     choice: Optional[str] = None
@@ -158,7 +245,7 @@ def configure_audio_settings(settings: Settings) -> None:
             )
             if noise_suppression is not None:
                 settings.mic.noise_suppression = noise_suppression
-                settings.save()
+                settings.mark_dirty()
         elif choice == "gain":
             while True:
                 auto_gain = inputbox("Auto Gain (0-31 dbFS)", settings.mic.auto_gain)
@@ -173,7 +260,7 @@ def configure_audio_settings(settings: Settings) -> None:
 
                 if 0 <= auto_gain_int <= 31:
                     settings.mic.auto_gain = auto_gain_int
-                    settings.save()
+                    settings.mark_dirty()
                     break
 
                 msgbox("Must be 0-31")
@@ -193,7 +280,7 @@ def configure_audio_settings(settings: Settings) -> None:
 
                 if volume_multiplier_float > 0:
                     settings.mic.volume_multiplier = volume_multiplier_float
-                    settings.save()
+                    settings.mark_dirty()
                     break
 
                 msgbox("Must be > 0")
@@ -212,3 +299,13 @@ def audio_settings_menu(last_choice: Optional[str]) -> Optional[str]:
         selected_item=last_choice,
         menu_args=["--ok-button", "Select", "--cancel-button", "Back"],
     )
+
+
+def _sum_squares(audio: bytes) -> int:
+    """Sum of squared 16-bit little-endian samples."""
+    if _HAS_NUMPY:
+        samples = np.frombuffer(audio, dtype="<i2")
+        return int(np.square(samples, dtype=np.int64).sum())
+
+    audio_array = array.array("h", audio)
+    return sum(map(operator.mul, audio_array, audio_array))
@@ -1,9 +1,10 @@
 """Install system packages."""
 import logging
 import subprocess
+from typing import Optional
 
 from .const import PROGRAM_DIR
-from .whiptail import run_with_gauge
+from .whiptail import Gauge, run_with_gauge
 
 _LOGGER = logging.getLogger()
 
@@ -46,7 +47,11 @@ def install_packages_nogui(*packages, update: bool = True) -> bool:
 
 
 def install_packages(
-    text: str, sudo_password: str, *packages, update: bool = True
+    text: str,
+    sudo_password: str,
+    *packages,
+    update: bool = True,
+    progress: Optional[Gauge] = None,
 ) -> bool:
     assert packages, "No packages"
 
@@ -58,7 +63,9 @@ def install_packages(
         ["sudo", "-S", "apt-get", "install", "--yes"] + [str(p) for p in packages]
     )
 
-    return run_with_gauge(text, commands, sudo_password=sudo_password)
+    return run_with_gauge(
+        text, commands, sudo_password=sudo_password, progress=progress
+    )
 
 
 def can_import(*names) -> bool:
@@ -14,7 +14,7 @@ def configure_satellite(settings: Settings) -> None:
             name = inputbox("Satellite Name:", settings.satellite.name)
             if name:
                 settings.satellite.name = name
-                settings.save()
+                settings.mark_dirty()
         elif choice == "type":
             satellite_type = radiolist(
                 "Satellite Type:",
@@ -28,7 +28,7 @@ def configure_satellite(settings: Settings) -> None:
 
             if satellite_type is not None:
                 settings.satellite.type = SatelliteType(satellite_type)
-                settings.save()
+                settings.mark_dirty()
         elif choice == "feedback":
             configure_feedback(settings)
         elif choice in ("restart", "stop", "start"):
@@ -57,7 +57,7 @@ def configure_satellite(settings: Settings) -> None:
 
             if debug is not None:
                 settings.satellite.debug = debug == "enabled"
-                settings.save()
+                settings.mark_dirty()
         else:
             break
 
@@ -115,6 +115,6 @@ def configure_feedback(settings: Settings) -> None:
                         "tcp://127.0.0.1:10500",
                     ]
 
-                settings.save()
+                settings.mark_dirty()
         else:
             break
@@ -1,6 +1,6 @@
 """Systemd service management."""
-import shlex
-import subprocess
+import os
+import pwd
 from pathlib import Path
 from typing import List
 
@@ -16,15 +16,21 @@ from .whiptail import error, msgbox, run_with_gauge
 
 
 def stop_services(password: str) -> None:
-    stop_commands = []
+    service_filenames = []
     for service in ("satellite", "wakeword", "event"):
         service_filename = f"wyoming-{service}.service"
         service_path = Path("/etc/systemd/system") / service_filename
         if not service_path.exists():
             continue
 
-        stop_commands.append(["sudo", "-S", "systemctl", "stop", service_filename])
-        stop_commands.append(["sudo", "-S", "systemctl", "disable", service_filename])
+        service_filenames.append(service_filename)
+
+    stop_commands = []
+    if service_filenames:
+        # One systemctl call stops and disables all services
+        stop_commands.append(
+            ["sudo", "-S", "systemctl", "disable", "--now", *service_filenames]
+        )
 
     run_with_gauge("Stopping Services...", stop_commands, sudo_password=password)
 
@@ -32,8 +38,8 @@ def stop_services(password: str) -> None:
 def generate_services(settings: Settings) -> None:
     SERVICES_DIR.mkdir(parents=True, exist_ok=True)
 
-    user_id = subprocess.check_output(["id", "-u"], text=True).strip()
-    user_name = subprocess.check_output(["id", "--name", "-u"], text=True).strip()
+    user_id = os.getuid()
+    user_name = pwd.getpwuid(user_id).pw_name
 
     satellite_command: List[str] = [
         str(PROGRAM_DIR / "script" / "run"),
@@ -131,27 +137,26 @@ def generate_services(settings: Settings) -> None:
         if settings.satellite.debug:
             wake_word_command.append("--debug")
 
-        wake_word_command_str = shlex.join(wake_word_command)
+        wake_word_command_str = _systemd_join(wake_word_command)
 
-        with open(
-            SERVICES_DIR / f"{wake_word_service}.service", "w", encoding="utf-8"
-        ) as service_file:
-            print("[Unit]", file=service_file)
-            print(
+        _write_service(
+            SERVICES_DIR / f"{wake_word_service}.service",
+            [
+                "[Unit]",
                 f"Description={WakeWordSystem(settings.wake.system).value}",
-                file=service_file,
-            )
-            print("", file=service_file)
-            print("[Service]", file=service_file)
-            print("Type=simple", file=service_file)
-            print(f"User={user_name}", file=service_file)
-            print(f"ExecStart={wake_word_command_str}", file=service_file)
-            print(f"WorkingDirectory={wake_word_dir}", file=service_file)
-            print("Restart=always", file=service_file)
-            print("RestartSec=1", file=service_file)
-            print("", file=service_file)
-            print("[Install]", file=service_file)
-            print("WantedBy=default.target", file=service_file)
+                "",
+                "[Service]",
+                "Type=simple",
+                f"User={user_name}",
+                f"ExecStart={wake_word_command_str}",
+                f"WorkingDirectory={wake_word_dir}",
+                "Restart=always",
+                "RestartSec=1",
+                "",
+                "[Install]",
+                "WantedBy=default.target",
+            ],
+        )
 
         satellite_command.extend(
             [
@@ -165,23 +170,25 @@ def generate_services(settings: Settings) -> None:
 
     if settings.satellite.event_service_command:
         event_service = "wyoming-event"
-        event_command_str = shlex.join(settings.satellite.event_service_command)
-        with open(
-            SERVICES_DIR / f"{event_service}.service", "w", encoding="utf-8"
-        ) as service_file:
-            print("[Unit]", file=service_file)
-            print("Description=Event service", file=service_file)
-            print("", file=service_file)
-            print("[Service]", file=service_file)
-            print("Type=simple", file=service_file)
-            print(f"User={user_name}", file=service_file)
-            print(f"ExecStart={event_command_str}", file=service_file)
-            print(f"WorkingDirectory={PROGRAM_DIR}", file=service_file)
-            print("Restart=always", file=service_file)
-            print("RestartSec=1", file=service_file)
-            print("", file=service_file)
-            print("[Install]", file=service_file)
-            print("WantedBy=default.target", file=service_file)
+        event_command_str = _systemd_join(settings.satellite.event_service_command)
+        _write_service(
+            SERVICES_DIR / f"{event_service}.service",
+            [
+                "[Unit]",
+                "Description=Event service",
+                "",
+                "[Service]",
+                "Type=simple",
+                f"User={user_name}",
+                f"ExecStart={event_command_str}",
+                f"WorkingDirectory={PROGRAM_DIR}",
+                "Restart=always",
+                "RestartSec=1",
+                "",
+                "[Install]",
+                "WantedBy=default.target",
+            ],
+        )
 
         satellite_command.extend(["--event-uri", "tcp://127.0.0.1:10500"])
         satellite_requires.append(f"{event_service}.service")
@@ -191,33 +198,36 @@ def generate_services(settings: Settings) -> None:
             ["--debug", "--debug-recording-dir", str(LOCAL_DIR / "debug-recording")]
         )
 
-    satellite_command_str = shlex.join(satellite_command)
-
-    with open(
-        SERVICES_DIR / "wyoming-satellite.service", "w", encoding="utf-8"
-    ) as service_file:
-        print("[Unit]", file=service_file)
-        print("Description=Wyoming Satellite", file=service_file)
-        print("Wants=network-online.target", file=service_file)
-        print("After=network-online.target", file=service_file)
-        for requires in satellite_requires:
-            print(f"Requires={requires}", file=service_file)
-
-        print("", file=service_file)
-        print("[Service]", file=service_file)
-        print("Type=simple", file=service_file)
-        print(f"User={user_name}", file=service_file)
+    satellite_command_str = _systemd_join(satellite_command)
+
+    _write_service(
+        SERVICES_DIR / "wyoming-satellite.service",
+        [
+            "[Unit]",
+            "Description=Wyoming Satellite",
+            "Wants=network-online.target",
+            "After=network-online.target",
+            *(f"Requires={requires}" for requires in satellite_requires),
+            "",
+            "[Service]",
+            "Type=simple",
+            f"User={user_name}",
+            # For PulseAudio
+            f"Environment=XDG_RUNTIME_DIR=/run/user/{user_id}",
+            f"ExecStart={satellite_command_str}",
+            f"WorkingDirectory={PROGRAM_DIR}",
+            "Restart=always",
+            "RestartSec=1",
+            "",
+            "[Install]",
+            "WantedBy=default.target",
+        ],
+    )
 
-        # For PulseAudio
-        print(f"Environment=XDG_RUNTIME_DIR=/run/user/{user_id}", file=service_file)
 
-        print(f"ExecStart={satellite_command_str}", file=service_file)
-        print(f"WorkingDirectory={PROGRAM_DIR}", file=service_file)
-        print("Restart=always", file=service_file)
-        print("RestartSec=1", file=service_file)
-        print("", file=service_file)
-        print("[Install]", file=service_file)
-        print("WantedBy=default.target", file=service_file)
+def _write_service(service_path: Path, lines: List[str]) -> None:
+    """Write a systemd unit file in a single call."""
+    service_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
 def install_services(settings: Settings, password: str):
@@ -230,28 +240,23 @@ def install_services(settings: Settings, password: str):
     if settings.satellite.event_service_command:
         installed_services.append("event")
 
-    install_commands = []
-    for service in installed_services:
-        service_filename = f"wyoming-{service}.service"
-        install_commands.append(
-            [
-                "sudo",
-                "-S",
-                "cp",
-                str(SERVICES_DIR / service_filename),
-                "/etc/systemd/system/",
-            ]
-        )
-
-    install_commands.append(["sudo", "-S", "systemctl", "daemon-reload"])
-
-    # Copy first, then enable and start
-    for service in installed_services:
-        install_commands.append(["sudo", "-S", "systemctl", "enable", service_filename])
-
-    install_commands.append(
-        ["sudo", "-S", "systemctl", "enable", "--now", "wyoming-satellite.service"]
-    )
+    service_filenames = [f"wyoming-{service}.service" for service in installed_services]
+    install_commands = [
+        [
+            "sudo",
+            "-S",
+            "cp",
+            *(
+                str(SERVICES_DIR / service_filename)
+                for service_filename in service_filenames
+            ),
+            "/etc/systemd/system/",
+        ],
+        ["sudo", "-S", "systemctl", "daemon-reload"],
+        # Copy first, then enable and start
+        ["sudo", "-S", "systemctl", "enable", *service_filenames],
+        ["sudo", "-S", "systemctl", "enable", "--now", "wyoming-satellite.service"],
+    ]
 
     success = run_with_gauge(
         "Installing Services...", install_commands, sudo_password=password
@@ -260,3 +265,18 @@ def install_services(settings: Settings, password: str):
         msgbox("Successfully installed services")
     else:
         error("installing services")
+
+
+def _systemd_join(command: List[str]) -> str:
+    """Join a command for ExecStart= using systemd's quoting rules."""
+    return " ".join(_systemd_escape(arg) for arg in command)
+
+
+def _systemd_escape(arg: str) -> str:
+    """Escape a single ExecStart= argument."""
+    # % and $ are expanded by systemd (specifiers and environment variables)
+    arg = arg.replace("%", "%%").replace("$", "$$")
+    if arg and not any(c.isspace() or (c in "\\\"';") for c in arg):
+        return arg
+
+    return '"' + arg.replace("\\", "\\\\").replace('"', '\\"') + '"'
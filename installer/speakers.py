@@ -1,7 +1,8 @@
 """Speaker settings."""
+import functools
 import logging
 import subprocess
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from .const import PROGRAM_DIR, Settings
 from .whiptail import checklist, inputbox, menu, msgbox, radiolist
@@ -10,6 +11,9 @@ _LOGGER = logging.getLogger()
 
 
 def configure_speakers(settings: Settings) -> None:
+    # Devices are listed once per visit to this menu
+    invalidate_device_cache()
+
     choice: Optional[str] = None
     while True:
         choice = speakers_menu(choice)
@@ -24,7 +28,7 @@ def configure_speakers(settings: Settings) -> None:
             sound_device = test_speakers()
             if sound_device is not None:
                 settings.snd.device = sound_device
-                settings.save()
+                settings.mark_dirty()
         elif choice == "list":
             sound_device = radiolist(
                 "Select ALSA Device:",
@@ -33,15 +37,15 @@ def configure_speakers(settings: Settings) -> None:
             )
             if sound_device:
                 settings.snd.device = sound_device
-                settings.save()
+                settings.mark_dirty()
         elif choice == "manual":
             sound_device = inputbox("Enter ALSA Device:", settings.snd.device)
             if sound_device:
                 settings.snd.device = sound_device
-                settings.save()
+                settings.mark_dirty()
         elif choice == "disable":
             settings.snd.device = None
-            settings.save()
+            settings.mark_dirty()
             msgbox("Sound disabled")
         elif choice == "feedback":
             feedback_sounds = checklist(
@@ -52,7 +56,7 @@ def configure_speakers(settings: Settings) -> None:
 
             if feedback_sounds is not None:
                 settings.snd.feedback_sounds = feedback_sounds
-                settings.save()
+                settings.mark_dirty()
         elif choice == "multiplier":
             while True:
                 volume_multiplier = inputbox(
@@ -69,7 +73,7 @@ def configure_speakers(settings: Settings) -> None:
 
                 if volume_multiplier_float > 0:
                     settings.snd.volume_multiplier = volume_multiplier_float
-                    settings.save()
+                    settings.mark_dirty()
                     break
 
                 msgbox("Must be > 0")
@@ -95,16 +99,31 @@ def speakers_menu(last_choice: Optional[str]) -> Optional[str]:
 
 
 def get_sound_devices() -> List[str]:
+    """Return ALSA devices from aplay -L (cached until invalidate_device_cache)."""
+    return list(_list_sound_devices())
+
+
+def invalidate_device_cache() -> None:
+    """Re-list devices on the next call to get_sound_devices."""
+    _list_sound_devices.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _list_sound_devices() -> Tuple[str, ...]:
     devices = []
-    lines = subprocess.check_output(["aplay", "-L"]).decode("utf-8").splitlines()
-    for line in lines:
+    output = subprocess.check_output(
+        ["aplay", "-L"], stdin=subprocess.DEVNULL, close_fds=False
+    )
+
+    # Only decode the lines that are kept
+    for line in output.splitlines():
         line = line.strip()
 
         # default = PulseAudio
-        if (line == "default") or line.startswith("plughw:"):
-            devices.append(line)
+        if (line == b"default") or line.startswith(b"plughw:"):
+            devices.append(line.decode("utf-8"))
 
-    return devices
+    return tuple(devices)
 
 
 def test_speakers() -> Optional[str]:
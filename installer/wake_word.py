@@ -3,11 +3,12 @@ import itertools
 import re
 import shutil
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from .const import LOCAL_DIR, SatelliteType, Settings, WakeWordSystem
 from .packages import install_packages, packages_installed
 from .whiptail import (
+    Gauge,
     error,
     inputbox,
     menu,
@@ -15,9 +16,15 @@ from .whiptail import (
     passwordbox,
     radiolist,
     run_with_gauge,
+    run_with_gauge_chain,
     yesno,
 )
 
+# Extra system packages needed to install each wake word system
+_SYSTEM_PACKAGES: Dict[WakeWordSystem, List[str]] = {
+    WakeWordSystem.SNOWBOY: ["python3-dev", "swig", "libatlas-base-dev"],
+}
+
 
 def configure_wake_word(settings: Settings) -> None:
     if settings.satellite.type != SatelliteType.WAKE:
@@ -25,7 +32,7 @@ def configure_wake_word(settings: Settings) -> None:
             return
 
         settings.satellite.type = SatelliteType.WAKE
-        settings.save()
+        settings.mark_dirty()
 
     def star(ww_system: WakeWordSystem) -> str:
         return (
@@ -73,125 +80,69 @@ def configure_wake_word(settings: Settings) -> None:
 
 
 def install_wake_word(settings: Settings, wake_word_system: WakeWordSystem) -> None:
-    if wake_word_system == WakeWordSystem.OPENWAKEWORD:
-        oww_dir = LOCAL_DIR / "wyoming-openwakeword"
-        if not oww_dir.exists():
-            if not yesno("Install openWakeWord?"):
-                return
-
-            success = run_with_gauge(
-                "Installing openWakeWord",
-                [
-                    [
-                        "git",
-                        "clone",
-                        "https://github.com/rhasspy/wyoming-openwakeword.git",
-                        str(oww_dir),
-                    ],
-                    [str(oww_dir / "script" / "setup")],
-                ],
-            )
-
-            if not success:
-                # Clean up
-                try:
-                    shutil.rmtree(oww_dir)
-                except Exception:
-                    pass
+    name = wake_word_system.value
+    system_dir = _wake_word_system_dir(wake_word_system)
+    if not system_dir.exists():
+        if not yesno(f"Install {name}?"):
+            return
 
-                error("installing openWakeWord")
+        system_packages = _SYSTEM_PACKAGES.get(wake_word_system, [])
+        password: Optional[str] = None
+        if system_packages and (not packages_installed(*system_packages)):
+            password = passwordbox("sudo password:")
+            if not password:
                 return
 
-        msgbox("openWakeWord installed successfully")
-        settings.wake.system = wake_word_system
-        settings.save()
-        return
-
-    if wake_word_system == WakeWordSystem.PORCUPINE1:
-        porcupine1_dir = LOCAL_DIR / "wyoming-porcupine1"
-        if not porcupine1_dir.exists():
-            if not yesno("Install porcupine1?"):
-                return
+        # Single gauge for system packages and wake word system
+        packages_success = True
+        success = False
+        with Gauge(f"Installing {name}") as progress:
+            if password is not None:
+                packages_success = install_packages(
+                    "Installing system packages...",
+                    password,
+                    *system_packages,
+                    progress=progress,
+                )
 
-            success = run_with_gauge(
-                "Installing porcupine1",
-                [
+            if packages_success:
+                success = run_with_gauge_chain(
+                    f"Installing {name}",
                     [
-                        "git",
-                        "clone",
-                        "https://github.com/rhasspy/wyoming-porcupine1.git",
-                        str(porcupine1_dir),
+                        [
+                            "git",
+                            "clone",
+                            "--depth=1",
+                            f"https://github.com/rhasspy/{system_dir.name}.git",
+                            str(system_dir),
+                        ],
+                        [str(system_dir / "script" / "setup")],
                     ],
-                    [str(porcupine1_dir / "script" / "setup")],
-                ],
-            )
-
-            if not success:
-                # Clean up
-                try:
-                    shutil.rmtree(porcupine1_dir)
-                except Exception:
-                    pass
-
-                error("installing porcupine1")
-                return
-
-        msgbox("porcupine1 installed successfully")
-        settings.wake.system = wake_word_system
-        settings.save()
-        return
-
-    if wake_word_system == WakeWordSystem.SNOWBOY:
-        snowboy_dir = LOCAL_DIR / "wyoming-snowboy"
-        if not snowboy_dir.exists():
-            if not yesno("Install snowboy?"):
-                return
-
-            snowboy_packages = ["python3-dev", "swig", "libatlas-base-dev"]
-            if not packages_installed(*snowboy_packages):
-                password = passwordbox("sudo password:")
-                if not password:
-                    return
-
-                success = install_packages(
-                    "Installing system packages...", password, *snowboy_packages
+                    progress=progress,
                 )
-                if not success:
-                    error("installing " + ", ".join(snowboy_packages))
-                    return
 
-            success = run_with_gauge(
-                "Installing snowboy",
-                [
-                    [
-                        "git",
-                        "clone",
-                        "https://github.com/rhasspy/wyoming-snowboy.git",
-                        str(snowboy_dir),
-                    ],
-                    [str(snowboy_dir / "script" / "setup")],
-                ],
-            )
+        if not packages_success:
+            error("installing " + ", ".join(system_packages))
+            return
 
-            if not success:
-                # Clean up
-                try:
-                    shutil.rmtree(snowboy_dir)
-                except Exception:
-                    pass
+        if not success:
+            # Clean up
+            try:
+                shutil.rmtree(system_dir)
+            except Exception:
+                pass
 
-                error("installing snowboy")
-                return
+            error(f"installing {name}")
+            return
 
-        msgbox("snowboy installed successfully")
-        settings.wake.system = wake_word_system
-        settings.save()
-        return
+    msgbox(f"{name} installed successfully")
+    settings.wake.system = wake_word_system
+    settings.mark_dirty()
 
 
 def select_wake_word(settings: Settings) -> None:
     if settings.wake.system == WakeWordSystem.OPENWAKEWORD:
-        oww_dir = LOCAL_DIR / "wyoming-openwakeword"
+        oww_dir = _wake_word_system_dir(WakeWordSystem.OPENWAKEWORD)
         if not oww_dir.exists():
             msgbox("openWakeWord is not installed")
             return
@@ -238,13 +189,13 @@ def select_wake_word(settings: Settings) -> None:
                 shutil.copy(wake_word_path, custom_wake_word_dir)
 
             settings.wake.openwakeword.wake_word = wake_word
-            settings.save()
+            settings.mark_dirty()
             break
 
         return
 
     if settings.wake.system == WakeWordSystem.PORCUPINE1:
-        porcupine1_dir = LOCAL_DIR / "wyoming-porcupine1"
+        porcupine1_dir = _wake_word_system_dir(WakeWordSystem.PORCUPINE1)
         if not porcupine1_dir.exists():
             msgbox("porcupine1 is not installed")
             return
@@ -265,12 +216,12 @@ def select_wake_word(settings: Settings) -> None:
         )
         if wake_word is not None:
             settings.wake.porcupine1.wake_word = wake_word
-            settings.save()
+            settings.mark_dirty()
 
         return
 
     if settings.wake.system == WakeWordSystem.SNOWBOY:
-        snowboy_dir = LOCAL_DIR / "wyoming-snowboy"
+        snowboy_dir = _wake_word_system_dir(WakeWordSystem.SNOWBOY)
         if not snowboy_dir.exists():
             msgbox("snowboy is not installed")
             return
@@ -294,7 +245,7 @@ def select_wake_word(settings: Settings) -> None:
         wake_word = radiolist("Wake Word:", ww_names, settings.wake.snowboy.wake_word)
         if wake_word is not None:
             settings.wake.snowboy.wake_word = wake_word
-            settings.save()
+            settings.mark_dirty()
 
         return
 
@@ -323,6 +274,7 @@ def configure_openWakeWord(settings: Settings) -> None:
                         [
                             "git",
                             "clone",
+                            "--depth=1",
                             "https://github.com/fwartner/home-assistant-wakewords-collection.git",
                             str(community_wake_word_dir),
                         ]
@@ -365,7 +317,7 @@ def configure_openWakeWord(settings: Settings) -> None:
 
                 if 0 < threshold_float < 1:
                     settings.wake.openwakeword.threshold = threshold_float
-                    settings.save()
+                    settings.mark_dirty()
                     break
 
                 msgbox("Threshold must be in (0, 1)")
@@ -386,7 +338,7 @@ def configure_openWakeWord(settings: Settings) -> None:
 
                 if trigger_level_int > 0:
                     settings.wake.openwakeword.trigger_level = trigger_level_int
-                    settings.save()
+                    settings.mark_dirty()
                     break
 
                 msgbox("Trigger level must be > 0")
@@ -423,7 +375,7 @@ def configure_porcupine1(settings: Settings) -> None:
 
                 if 0 < sensitivity_float < 1:
                     settings.wake.porcupine1.sensitivity = sensitivity_float
-                    settings.save()
+                    settings.mark_dirty()
                     break
 
                 msgbox("Sensitivity must be in (0, 1)")
@@ -460,9 +412,14 @@ def configure_snowboy(settings: Settings) -> None:
 
                 if 0 < sensitivity_float < 1:
                     settings.wake.snowboy.sensitivity = sensitivity_float
-                    settings.save()
+                    settings.mark_dirty()
                     break
 
                 msgbox("Sensitivity must be in (0, 1)")
         else:
             break
+
+
+def _wake_word_system_dir(wake_word_system: WakeWordSystem) -> Path:
+    """Directory where a wake word system is installed."""
+    return LOCAL_DIR / ("wyoming-" + wake_word_system.value.lower())
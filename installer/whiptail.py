@@ -1,10 +1,12 @@
 """Python interface to whiptail command."""
+import atexit
 import logging
+import os
 import shlex
 import subprocess
 import time
 from collections.abc import Sequence
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .const import HEIGHT, LIST_HEIGHT, TITLE, WIDTH
@@ -13,20 +15,47 @@ ItemType = Union[str, Tuple[Any, str]]
 
 _LOGGER = logging.getLogger()
 
+# Shared by all gauged commands instead of creating a pool per call.
+# Commands run one at a time, so a single worker is enough.
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="installer")
+atexit.register(_EXECUTOR.shutdown)
 
-def whiptail(*args) -> Optional[str]:
-    proc = subprocess.Popen(
-        ["whiptail", "--title", TITLE] + list(args),
-        stderr=subprocess.PIPE,
-    )
 
-    _stdout, stderr = proc.communicate()
-    if proc.returncode != 0:
+def whiptail(*args) -> Optional[str]:
+    returncode, stderr = _spawn_whiptail(["--title", TITLE, *args])
+    if returncode != 0:
         return None
 
     return stderr.decode("utf-8")
 
 
+def _spawn_whiptail(args: Sequence[str]) -> Tuple[int, bytes]:
+    """Run whiptail with posix_spawn and capture stderr (the dialog result)."""
+    read_fd, write_fd = os.pipe()
+    try:
+        pid = os.posix_spawnp(
+            "whiptail",
+            ["whiptail", *args],
+            os.environ,
+            file_actions=[(os.POSIX_SPAWN_DUP2, write_fd, 2)],
+        )
+    except Exception:
+        os.close(read_fd)
+        raise
+    finally:
+        os.close(write_fd)
+
+    stderr_chunks: List[bytes] = []
+    try:
+        while chunk := os.read(read_fd, 4096):
+            stderr_chunks.append(chunk)
+    finally:
+        os.close(read_fd)
+
+    _pid, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status), b"".join(stderr_chunks)
+
+
 def menu(
     text: str,
     items: Sequence[ItemType],
@@ -85,26 +114,16 @@ def radiolist(
 
     item_map: Dict[str, ItemType] = {}
     item_args: List[str] = []
+    add_item_args = item_args.extend
     for i, item in enumerate(items):
         item_id = str(i)
-        item_args.append(item_id)
-
         if isinstance(item, str):
-            item_map[item_id] = item
-            item_args.append(item)
-
-            if item == selected_item:
-                item_args.append("1")
-            else:
-                item_args.append("0")
+            item_key, item_label = item, item
         else:
-            item_map[item_id] = item[0]
-            item_args.append(item[1])
+            item_key, item_label = item[0], item[1]
 
-            if item[0] == selected_item:
-                item_args.append("1")
-            else:
-                item_args.append("0")
+        item_map[item_id] = item_key
+        add_item_args((item_id, item_label, "1" if item_key == selected_item else "0"))
 
     result = whiptail(
         "--notags", *args, "--radiolist", text, HEIGHT, WIDTH, LIST_HEIGHT, *item_args
@@ -126,26 +145,17 @@ def checklist(
 
     item_map: Dict[str, ItemType] = {}
     item_args: List[str] = []
+    add_item_args = item_args.extend
+    selected_set = set(selected_items)
     for i, item in enumerate(items):
         item_id = str(i)
-        item_args.append(item_id)
-
         if isinstance(item, str):
-            item_map[item_id] = item
-            item_args.append(item)
-
-            if item in selected_items:
-                item_args.append("1")
-            else:
-                item_args.append("0")
+            item_key, item_label = item, item
         else:
-            item_map[item_id] = item[0]
-            item_args.append(item[1])
+            item_key, item_label = item[0], item[1]
 
-            if item[0] in selected_items:
-                item_args.append("1")
-            else:
-                item_args.append("0")
+        item_map[item_id] = item_key
+        add_item_args((item_id, item_label, "1" if item_key in selected_set else "0"))
 
     result = whiptail(
         "--notags", *args, "--checklist", text, HEIGHT, WIDTH, LIST_HEIGHT, *item_args
@@ -154,8 +164,10 @@ def checklist(
     if result is None:
         return None
 
+    # Tags are item indexes, so they never contain spaces or escaped quotes
     return [
-        item_map.get(result_item, result_item) for result_item in shlex.split(result)
+        item_map.get(result_item, result_item)
+        for result_item in result.replace('"', "").split()
     ]
 
 
@@ -168,21 +180,15 @@ def msgbox(text: str) -> None:
 
 
 def gauge(text: str, seconds: int, parts: int = 20) -> None:
-    proc = subprocess.Popen(
-        ["whiptail", "--title", TITLE, "--gauge", text, HEIGHT, WIDTH, "0"],
-        stdin=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    )
-    assert proc.stdin is not None
-
-    percent = 0
-    while percent <= 100:
-        time.sleep(seconds / parts)
-        percent += int(100 / parts)
-        print(percent, file=proc.stdin, flush=True)
-
-    proc.communicate()
+    with Gauge(text) as progress:
+        # Sleep until absolute deadlines so updates don't drift
+        tick_seconds = seconds / parts
+        step = max(1, 100 // parts)
+        next_tick = time.monotonic()
+        for percent in range(step, 101, step):
+            next_tick += tick_seconds
+            time.sleep(max(0.0, next_tick - time.monotonic()))
+            progress.update(percent)
 
 
 def error(reason: str) -> None:
@@ -194,55 +200,121 @@ def error(reason: str) -> None:
 # -----------------------------------------------------------------------------
 
 
+class Gauge:
+    """whiptail gauge process that can be reused across operations."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._percent: Optional[int] = None
+        self._proc: "Optional[subprocess.Popen[bytes]]" = None
+
+    def __enter__(self) -> "Gauge":
+        self._proc = subprocess.Popen(
+            ["whiptail", "--title", TITLE, "--gauge", self.text, HEIGHT, WIDTH, "0"],
+            stdin=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,  # each update is a single write, no flush needed
+        )
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._proc is not None:
+            # Gauge exits when stdin is closed
+            assert self._proc.stdin is not None
+            self._proc.stdin.close()
+            self._proc.wait()
+            self._proc = None
+
+    def update(self, percent: int) -> None:
+        """Set percentage shown in the gauge."""
+        if percent == self._percent:
+            return
+
+        self._percent = percent
+        self._write(b"%d\n" % percent)
+
+    def set_text(self, text: str, percent: int = 0) -> None:
+        """Change the gauge text and percentage."""
+        self.text = text
+        self._percent = percent
+        self._write(b"XXX\n%d\n%s\nXXX\n" % (percent, text.encode("utf-8")))
+
+    def _write(self, data: bytes) -> None:
+        assert (self._proc is not None) and (self._proc.stdin is not None)
+        self._proc.stdin.write(data)
+
+
 def run_with_gauge(
-    text: str, commands: Sequence[Sequence[str]], sudo_password: Optional[str] = None
+    text: str,
+    commands: Sequence[Sequence[str]],
+    sudo_password: Optional[str] = None,
+    progress: Optional[Gauge] = None,
 ) -> bool:
-    proc = subprocess.Popen(
-        ["whiptail", "--title", TITLE, "--gauge", text, HEIGHT, WIDTH, "0"],
-        stdin=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    )
-    assert proc.stdin is not None
+    if progress is None:
+        with Gauge(text) as new_progress:
+            return run_with_gauge(text, commands, sudo_password, new_progress)
+
+    if progress.text != text:
+        progress.set_text(text)
+
     percent = 0
     seconds = 5
     parts = 20
+    step = max(1, 100 // parts)
 
-    with ThreadPoolExecutor() as executor:
-        for command in commands:
-            future = executor.submit(_run_command, command, sudo_password)
-            while not future.done():
-                time.sleep(seconds / parts)
-                percent += int(100 / parts)
-                if percent > 100:
-                    percent = 0
+    for command in commands:
+        future = _EXECUTOR.submit(_run_command, command, sudo_password)
 
-                print(percent, file=proc.stdin, flush=True)
+        # Stops waiting as soon as the command finishes, not on the next tick
+        while not wait([future], timeout=seconds / parts).done:
+            # Wrap back around to 0 after 100%
+            percent = (percent + step) % 101
+            progress.update(percent)
 
-            if not future.result():
-                # Error occurred
-                return False
+        if not future.result():
+            # Error occurred
+            return False
 
-    proc.communicate()
     return True
 
 
+def run_with_gauge_chain(
+    text: str, commands: Sequence[Sequence[str]], progress: Optional[Gauge] = None
+) -> bool:
+    """Run commands in a single shell, stopping at the first failure."""
+    command_str = " && ".join(shlex.join(command) for command in commands)
+    return run_with_gauge(text, [["sh", "-c", command_str]], progress=progress)
+
+
 def _run_command(command: Sequence[str], sudo_password: Optional[str] = None) -> bool:
     try:
         assert command
-        proc_input: Optional[str] = None
+        proc_stdin = subprocess.DEVNULL
         if (command[0] == "sudo") and (sudo_password is not None):
-            proc_input = sudo_password
-
-        proc = subprocess.Popen(
-            command,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        _stdout, stderr = proc.communicate(proc_input)
-        if proc.returncode != 0:
+            # Password is small enough to fit in the pipe buffer, so it can be
+            # written up front instead of fed through communicate().
+            proc_stdin, write_fd = os.pipe()
+            os.write(write_fd, sudo_password.encode("utf-8") + b"\n")
+            os.close(write_fd)
+
+        try:
+            proc = subprocess.Popen(
+                command,
+                stdin=proc_stdin,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        finally:
+            if proc_stdin != subprocess.DEVNULL:
+                os.close(proc_stdin)
+
+        # stderr is the only pipe, so it can be read directly
+        assert proc.stderr is not None
+        with proc.stderr:
+            stderr = proc.stderr.read()
+
+        if proc.wait() != 0:
             _LOGGER.error("Error running command: %s", command)
             _LOGGER.error(stderr)
             return False
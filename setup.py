@@ -15,16 +15,11 @@ def get_requirements(req_path: Path) -> List[str]:
     if not req_path.is_file():
         return []
 
-    requirements: List[str] = []
-    with open(req_path, "r", encoding="utf-8") as req_file:
-        for line in req_file:
-            line = line.strip()
-            if not line:
-                continue
-
-            requirements.append(line)
-
-    return requirements
+    return [
+        line.strip()
+        for line in req_path.read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    ]
 
 
 install_requires = get_requirements(this_dir / "requirements.txt")
@@ -38,7 +33,7 @@ extras_require = {
 
 setup(
     name="wyoming_satellite",
-    version="1.1.0",
+    version=version,
     description="Wyoming server for remote voice satellite",
     url="http://github.com/rhasspy/wyoming-satellite",
     author="Michael Hansen",
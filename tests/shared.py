@@ -1,6 +1,5 @@
 """Shared code for Wyoming satellite tests."""
 import asyncio
-import io
 from collections.abc import Iterable
 from typing import Optional
 
@@ -14,50 +13,65 @@ AUDIO_STOP = AudioStop()
 AUDIO_CHUNK = AudioChunk(
     rate=16000, width=2, channels=1, audio=bytes([255] * 960)  # 30ms
 )
+AUDIO_CHUNK_EVENT = AUDIO_CHUNK.event()
+AUDIO_CHUNK_SECONDS = AUDIO_CHUNK.seconds
 
 
 class FakeStreamReaderWriter:
     def __init__(self) -> None:
-        self._undrained_data = bytes()
-        self._value = bytes()
-        self._data_ready = asyncio.Event()
+        self._undrained_data = bytearray()
+        self._value = bytearray()
+        self._read_pos = 0
+        self._data_ready = asyncio.Condition()
 
     def write(self, data: bytes) -> None:
-        self._undrained_data += data
+        self._undrained_data.extend(data)
 
     def writelines(self, data: Iterable[bytes]) -> None:
         for line in data:
             self.write(line)
 
     async def drain(self) -> None:
-        self._value += self._undrained_data
-        self._undrained_data = bytes()
-        self._data_ready.set()
-        self._data_ready.clear()
+        self._value.extend(self._undrained_data)
+        self._undrained_data.clear()
+
+        async with self._data_ready:
+            self._data_ready.notify_all()
 
     async def readline(self) -> bytes:
-        while b"\n" not in self._value:
-            await self._data_ready.wait()
+        async with self._data_ready:
+            while (newline_pos := self._value.find(b"\n", self._read_pos)) < 0:
+                await self._data_ready.wait()
 
-        with io.BytesIO(self._value) as value_io:
-            data = value_io.readline()
-            self._value = self._value[len(data) :]
-            return data
+            return self._read(newline_pos + 1 - self._read_pos)
 
     async def readexactly(self, n: int) -> bytes:
-        while len(self._value) < n:
-            await self._data_ready.wait()
+        async with self._data_ready:
+            while (len(self._value) - self._read_pos) < n:
+                await self._data_ready.wait()
+
+            return self._read(n)
+
+    def _read(self, n: int) -> bytes:
+        # Slice a view so the data is only copied once
+        with memoryview(self._value) as value_view:
+            data = bytes(value_view[self._read_pos : self._read_pos + n])
+
+        self._read_pos += n
+
+        # Compact once most of the buffer has been read
+        if self._read_pos > (len(self._value) // 2):
+            del self._value[: self._read_pos]
+            self._read_pos = 0
 
-        data = self._value[:n]
-        self._value = self._value[n:]
         return data
 
 
 class MicClient(AsyncClient):
     async def read_event(self) -> Optional[Event]:
         # Send 30ms of audio every 30ms
-        await asyncio.sleep(AUDIO_CHUNK.seconds)
-        return AUDIO_CHUNK.event()
+        await asyncio.sleep(AUDIO_CHUNK_SECONDS)
+        return AUDIO_CHUNK_EVENT
 
     async def write_event(self, event: Event) -> None:
         # Output only
@@ -0,0 +1,101 @@
+from wyoming.audio import AudioChunk, AudioStart, AudioStop
+
+from wyoming_satellite.utils import AudioRingBuffer, coalesce_audio_events
+
+
+def _chunk(audio: bytes, rate: int = 16000, timestamp: int = 0) -> AudioChunk:
+    return AudioChunk(rate=rate, width=2, channels=1, audio=audio, timestamp=timestamp)
+
+
+def test_coalesce_same_format() -> None:
+    events = [
+        _chunk(b"\x01\x02", timestamp=10).event(),
+        _chunk(b"\x03\x04", timestamp=20).event(),
+        _chunk(b"\x05\x06", timestamp=30).event(),
+    ]
+
+    merged = list(coalesce_audio_events(events))
+    assert len(merged) == 1
+
+    chunk = AudioChunk.from_event(merged[0])
+    assert chunk.audio == b"\x01\x02\x03\x04\x05\x06"
+    assert (chunk.rate, chunk.width, chunk.channels) == (16000, 2, 1)
+
+    # First chunk's timestamp is kept
+    assert chunk.timestamp == 10
+
+
+def test_coalesce_format_change() -> None:
+    formats = [
+        AudioChunk(rate=16000, width=2, channels=1, audio=b"\x01\x02"),
+        AudioChunk(rate=22050, width=2, channels=1, audio=b"\x03\x04"),
+        AudioChunk(rate=22050, width=4, channels=1, audio=b"\x05\x06\x07\x08"),
+        AudioChunk(rate=22050, width=4, channels=2, audio=b"\x09" * 8),
+    ]
+
+    # No merging across a rate, width, or channels change
+    merged = list(coalesce_audio_events(c.event() for c in formats))
+    assert [AudioChunk.from_event(e) for e in merged] == formats
+
+
+def test_coalesce_passthrough_order() -> None:
+    events = [
+        AudioStart(rate=16000, width=2, channels=1).event(),
+        _chunk(b"\x01\x02").event(),
+        _chunk(b"\x03\x04").event(),
+        AudioStop().event(),
+        _chunk(b"\x05\x06").event(),
+        AudioStop().event(),
+    ]
+
+    # Audio is only merged between other events, which keep their order
+    merged = list(coalesce_audio_events(events))
+    assert merged == [
+        events[0],
+        _chunk(b"\x01\x02\x03\x04").event(),
+        events[3],
+        events[4],
+        events[5],
+    ]
+
+
+def test_ring_buffer_before_wrap() -> None:
+    buffer = AudioRingBuffer(8)
+    assert len(buffer) == 0
+    assert buffer.getvalue() == b""
+
+    buffer.put(b"\x01\x02\x03")
+    assert len(buffer) == 3
+    assert buffer.getvalue() == b"\x01\x02\x03"
+
+
+def test_ring_buffer_wrap() -> None:
+    buffer = AudioRingBuffer(8)
+    buffer.put(b"\x01\x02\x03\x04\x05\x06")
+
+    # Split across the end of the buffer
+    buffer.put(b"\x07\x08\x09\x0a")
+    assert len(buffer) == 8
+    assert buffer.getvalue() == b"\x03\x04\x05\x06\x07\x08\x09\x0a"
+
+    # Exactly reaches the end of the buffer
+    buffer.put(b"\x0b\x0c\x0d\x0e\x0f\x10")
+    assert buffer.getvalue() == b"\x09\x0a\x0b\x0c\x0d\x0e\x0f\x10"
+
+    # Larger than the buffer
+    buffer.put(bytes(range(20, 30)))
+    assert len(buffer) == 8
+    assert buffer.getvalue() == bytes(range(22, 30))
+
+
+def test_ring_buffer_fill_silence() -> None:
+    buffer = AudioRingBuffer(8)
+    buffer.put(b"\x01\x02\x03")
+
+    buffer.fill_silence()
+    assert len(buffer) == buffer.maxlen == 8
+    assert buffer.getvalue() == bytes(8)
+
+    # Newest bytes come after the silence
+    buffer.put(b"\x01\x02")
+    assert buffer.getvalue() == bytes(6) + b"\x01\x02"
@@ -0,0 +1,189 @@
+import asyncio
+import time
+from pathlib import Path
+from typing import Final, List, Optional, Union
+from unittest.mock import patch
+
+import pytest
+from wyoming.event import Eventable
+
+from wyoming_satellite import EventSettings, MicSettings, SatelliteSettings
+from wyoming_satellite.satellite import SatelliteBase, State
+from wyoming_satellite.utils import PersistentEventCommands
+
+TIMEOUT: Final = 1
+
+
+class CommandRecorder:
+    """Stands in for run_event_command, recording each command it runs."""
+
+    def __init__(self) -> None:
+        self.commands: List[str] = []
+        self.ran = asyncio.Event()
+
+    async def __call__(
+        self,
+        command: Optional[List[str]],
+        command_input: Optional[Union[str, Eventable]] = None,
+    ) -> None:
+        assert command
+        if command[0] == "slow":
+            # Later commands must still wait for this one
+            await asyncio.sleep(0.1)
+
+        self.commands.append(command[0])
+        self.ran.set()
+
+    async def wait_for(self, num_commands: int) -> None:
+        while len(self.commands) < num_commands:
+            self.ran.clear()
+            await asyncio.wait_for(self.ran.wait(), timeout=TIMEOUT)
+
+
+def _make_satellite() -> SatelliteBase:
+    return SatelliteBase(
+        SatelliteSettings(
+            mic=MicSettings(),
+            event=EventSettings(
+                detect=["slow"], stt_start=["stt_start"], stt_stop=["stt_stop"]
+            ),
+            restart_timeout=0,
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_event_commands_run_in_order() -> None:
+    recorder = CommandRecorder()
+
+    with patch("wyoming_satellite.satellite.run_event_command", recorder):
+        satellite = _make_satellite()
+        satellite_task = asyncio.create_task(satellite.run(), name="satellite")
+
+        await satellite.trigger_detect()
+        await satellite.trigger_stt_start()
+        await satellite.trigger_stt_stop()
+        await recorder.wait_for(3)
+
+        assert recorder.commands == ["slow", "stt_start", "stt_stop"]
+
+        await satellite.stop()
+        await satellite_task
+
+
+@pytest.mark.asyncio
+async def test_event_commands_survive_restart() -> None:
+    recorder = CommandRecorder()
+
+    with patch("wyoming_satellite.satellite.run_event_command", recorder):
+        satellite = _make_satellite()
+        satellite_task = asyncio.create_task(satellite.run(), name="satellite")
+
+        # Queued right before a restart
+        await satellite.trigger_detect()
+        satellite.state = State.RESTARTING
+        await satellite.trigger_stt_start()
+        await recorder.wait_for(2)
+
+        assert recorder.commands == ["slow", "stt_start"]
+
+        await satellite.stop()
+        await satellite_task
+
+
+@pytest.mark.asyncio
+async def test_event_commands_finish_before_stop() -> None:
+    recorder = CommandRecorder()
+
+    with patch("wyoming_satellite.satellite.run_event_command", recorder):
+        satellite = _make_satellite()
+        satellite_task = asyncio.create_task(satellite.run(), name="satellite")
+
+        # Queued right before a stop
+        await satellite.trigger_detect()
+        await satellite.trigger_stt_stop()
+        await asyncio.wait_for(satellite.stop(), timeout=TIMEOUT)
+        await satellite_task
+
+        assert recorder.commands == ["slow", "stt_stop"]
+
+
+@pytest.mark.asyncio
+async def test_no_event_command_task_without_commands() -> None:
+    satellite = SatelliteBase(SatelliteSettings(mic=MicSettings()))
+    satellite_task = asyncio.create_task(satellite.run(), name="satellite")
+    await asyncio.sleep(0)
+
+    # pylint: disable=protected-access
+    assert satellite._event_command_task is None
+
+    await satellite.stop()
+    await satellite_task
+
+
+async def _wait_for_lines(path: Path, num_lines: int) -> List[str]:
+    async def _read_lines() -> List[str]:
+        while True:
+            if path.exists():
+                lines = path.read_text(encoding="utf-8").splitlines()
+                if len(lines) >= num_lines:
+                    return lines
+
+            await asyncio.sleep(0.01)
+
+    return await asyncio.wait_for(_read_lines(), timeout=TIMEOUT)
+
+
+@pytest.mark.asyncio
+async def test_persistent_one_line_per_event(tmp_path: Path) -> None:
+    output_path = tmp_path / "output.txt"
+    command = ["sh", "-c", f"cat >> '{output_path}'"]
+    commands = PersistentEventCommands()
+
+    await commands.run(command, "first\nevent")
+    await commands.run(command)
+    await commands.run(command, "second")
+
+    assert await _wait_for_lines(output_path, 3) == ["first event", "", "second"]
+
+    await asyncio.wait_for(commands.close(), timeout=TIMEOUT)
+
+
+@pytest.mark.asyncio
+async def test_persistent_respawn(tmp_path: Path) -> None:
+    output_path = tmp_path / "output.txt"
+
+    # Exits after each line
+    command = ["sh", "-c", f"head -n 1 >> '{output_path}'"]
+    commands = PersistentEventCommands()
+
+    await commands.run(command, "first")
+    assert await _wait_for_lines(output_path, 1) == ["first"]
+
+    # pylint: disable=protected-access
+    first_proc = commands._procs[tuple(command)]
+    await asyncio.wait_for(first_proc.wait(), timeout=TIMEOUT)
+
+    await commands.run(command, "second")
+    assert await _wait_for_lines(output_path, 2) == ["first", "second"]
+    assert commands._procs[tuple(command)] is not first_proc
+
+    await asyncio.wait_for(commands.close(), timeout=TIMEOUT)
+
+
+@pytest.mark.asyncio
+async def test_persistent_close_stuck_command() -> None:
+    # Ignores stdin closing and SIGTERM
+    command = ["sh", "-c", "trap '' TERM; exec sleep 60"]
+    commands = PersistentEventCommands()
+
+    await commands.run(command, "event")
+
+    # pylint: disable=protected-access
+    proc = commands._procs[tuple(command)]
+
+    start_time = time.monotonic()
+    await asyncio.wait_for(commands.close(timeout=0.1), timeout=TIMEOUT)
+
+    assert proc.returncode is not None
+    assert (time.monotonic() - start_time) < TIMEOUT
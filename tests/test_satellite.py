@@ -23,7 +23,7 @@ from wyoming_satellite import (
 )
 
 from .shared import (
-    AUDIO_CHUNK,
+    AUDIO_CHUNK_EVENT,
     AUDIO_START,
     AUDIO_STOP,
     FakeStreamReaderWriter,
@@ -210,7 +210,7 @@ async def test_wake_satellite() -> None:
         await asyncio.wait_for(event_client.audio_start.wait(), timeout=TIMEOUT)
 
         # Event service does not get audio chunks, just start/stop
-        await satellite.event_from_server(AUDIO_CHUNK.event())
+        await satellite.event_from_server(AUDIO_CHUNK_EVENT)
         await asyncio.wait_for(snd_client.audio_chunk.wait(), timeout=TIMEOUT)
 
         await satellite.event_from_server(AUDIO_STOP.event())
@@ -6,7 +6,6 @@ from unittest.mock import patch
 
 import pytest
 from wyoming.asr import Transcript
-from wyoming.audio import AudioChunk
 from wyoming.client import AsyncClient
 from wyoming.event import Event
 from wyoming.satellite import RunSatellite
@@ -20,23 +19,49 @@ from wyoming_satellite import (
     WakeStreamingSatellite,
 )
 
-from .shared import MicClient
+from .shared import AUDIO_CHUNK_EVENT, MicClient
 
 _LOGGER = logging.getLogger()
 
+# Compared directly in the per-chunk write_event methods
+_AUDIO_CHUNK_TYPE = AUDIO_CHUNK_EVENT.type
+_DETECTION_TYPE = Detection().event().type
+
+
+class FakeClock:
+    """Stands in for the time module so tests can skip ahead."""
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+
+    def monotonic(self) -> float:
+        return self.seconds
+
+    def monotonic_ns(self) -> int:
+        return int(self.seconds * 1e9)
+
 
 class WakeClient(AsyncClient):
     def __init__(self) -> None:
         super().__init__()
-        self._detection_event = asyncio.Event()
+        self._detections: "asyncio.Queue[Event]" = asyncio.Queue(maxsize=1)
+
+        # The satellite reads again only after handling the previous event
+        self.num_reads = 0
+        self.last_detection_read = 0
+        self.read_started = asyncio.Event()
 
     async def read_event(self) -> Optional[Event]:
-        await self._detection_event.wait()
-        return Detection().event()
+        self.num_reads += 1
+        self.read_started.set()
+        detection = await self._detections.get()
+        self.last_detection_read = self.num_reads
+        return detection
 
     async def write_event(self, event: Event) -> None:
-        if AudioChunk.is_type(event.type):
-            self._detection_event.set()
+        # Detect on audio, handing the detection straight to the reader
+        if (event.type == _AUDIO_CHUNK_TYPE) and (not self._detections.full()):
+            self._detections.put_nowait(Detection().event())
 
 
 class EventClient(AsyncClient):
@@ -49,7 +74,7 @@ class EventClient(AsyncClient):
         return None
 
     async def write_event(self, event: Event) -> None:
-        if Detection.is_type(event.type):
+        if event.type == _DETECTION_TYPE:
             self.wake_event.set()
 
 
@@ -58,8 +83,9 @@ async def test_multiple_wakeups(tmp_path: Path) -> None:
     mic_client = MicClient()
     wake_client = WakeClient()
     event_client = EventClient()
+    clock = FakeClock()
 
-    with patch(
+    with patch("wyoming_satellite.satellite.time", clock), patch(
         "wyoming_satellite.satellite.SatelliteBase._make_mic_client",
         return_value=mic_client,
     ), patch(
@@ -90,8 +116,81 @@ async def test_multiple_wakeups(tmp_path: Path) -> None:
         await satellite.event_from_server(Transcript("test").event())
 
         # Should not trigger again within refractory period (default: 5 sec)
-        with pytest.raises(asyncio.TimeoutError):
-            await asyncio.wait_for(event_client.wake_event.wait(), timeout=0.15)
+        clock.seconds += 1
+        await _next_detection(wake_client)
+        assert not event_client.wake_event.is_set()
+
+        # Should trigger again after refractory period
+        clock.seconds += 5
+        await asyncio.wait_for(event_client.wake_event.wait(), timeout=1)
 
         await satellite.stop()
         await satellite_task
+
+
+class FailingWakeSatellite(WakeStreamingSatellite):
+    """Raises while handling the first event from the wake service."""
+
+    def __init__(self, settings: SatelliteSettings) -> None:
+        super().__init__(settings)
+        self.wake_errors = 0
+
+    async def event_from_wake(self, event: Event) -> None:
+        if self.wake_errors == 0:
+            self.wake_errors += 1
+            raise RuntimeError("test")
+
+        await super().event_from_wake(event)
+
+
+@pytest.mark.asyncio
+async def test_wake_handler_error_keeps_connection() -> None:
+    mic_client = MicClient()
+    wake_client = WakeClient()
+    event_client = EventClient()
+
+    with patch(
+        "wyoming_satellite.satellite.SatelliteBase._make_mic_client",
+        return_value=mic_client,
+    ), patch(
+        "wyoming_satellite.satellite.SatelliteBase._make_wake_client",
+        return_value=wake_client,
+    ) as make_wake_client, patch(
+        "wyoming_satellite.satellite.SatelliteBase._make_event_client",
+        return_value=event_client,
+    ):
+        satellite = FailingWakeSatellite(
+            SatelliteSettings(
+                mic=MicSettings(uri="test"),
+                wake=WakeSettings(uri="test"),
+                event=EventSettings(uri="test"),
+            )
+        )
+
+        # Fake server connection
+        satellite.server_id = "test"
+
+        satellite_task = asyncio.create_task(satellite.run(), name="satellite")
+        await satellite.event_from_server(RunSatellite().event())
+
+        # First detection fails, second one gets through on the same connection
+        await asyncio.wait_for(event_client.wake_event.wait(), timeout=1)
+        assert satellite.wake_errors == 1
+        assert make_wake_client.call_count == 1
+
+        await satellite.stop()
+        await satellite_task
+
+
+async def _next_detection(wake_client: WakeClient) -> None:
+    """Wait until the satellite has read and handled another detection."""
+    last_detection_read = wake_client.last_detection_read
+
+    async def _detection_handled() -> None:
+        while (wake_client.last_detection_read == last_detection_read) or (
+            wake_client.num_reads == wake_client.last_detection_read
+        ):
+            wake_client.read_started.clear()
+            await wake_client.read_started.wait()
+
+    await asyncio.wait_for(_detection_handled(), timeout=1)
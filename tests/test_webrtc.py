@@ -0,0 +1,29 @@
+import pytest
+
+
+def test_webrtc_byte_order() -> None:
+    webrtc_noise_gain = pytest.importorskip("webrtc_noise_gain")
+
+    from wyoming_satellite.webrtc import WebRtcAudio
+
+    sub_chunk_bytes = 320  # 10ms @ 16Khz
+    webrtc = WebRtcAudio(auto_gain=4, noise_suppression=2)
+    expected_processor = webrtc_noise_gain.AudioProcessor(4, 2)
+
+    # Ragged chunk sizes so leftover bytes are carried between calls
+    audio = bytes(i % 256 for i in range(sub_chunk_bytes * 20))
+    chunk_sizes = [100, 500, 320, 1000, 1280, 3200]
+
+    actual = bytes()
+    offset = 0
+    for chunk_size in chunk_sizes:
+        actual += webrtc(audio[offset : offset + chunk_size])
+        offset += chunk_size
+
+    # Previous implementation: one 10ms sub-chunk at a time, concatenated
+    expected = bytes()
+    for sub_chunk_idx in range(0, offset - sub_chunk_bytes + 1, sub_chunk_bytes):
+        sub_chunk = audio[sub_chunk_idx : sub_chunk_idx + sub_chunk_bytes]
+        expected += expected_processor.Process10ms(sub_chunk).audio
+
+    assert actual == expected
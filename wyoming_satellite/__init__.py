@@ -17,7 +17,17 @@ from .settings import (
 )
 
 _DIR = Path(__file__).parent
-__version__ = (_DIR / "VERSION").read_text(encoding="utf-8").strip()
+
+
+def __getattr__(name: str) -> str:
+    """Read __version__ lazily so importing the package doesn't touch disk."""
+    if name == "__version__":
+        version = (_DIR / "VERSION").read_bytes().strip().decode("utf-8")
+        globals()["__version__"] = version
+        return version
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "__version__",
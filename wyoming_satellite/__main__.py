@@ -3,9 +3,11 @@
 import argparse
 import asyncio
 import logging
+import signal
 import sys
 from functools import partial
 from pathlib import Path
+from typing import Optional
 
 from wyoming.info import Attribution, Info, Satellite
 from wyoming.server import AsyncServer, AsyncTcpServer
@@ -42,6 +44,209 @@ _DIR = Path(__file__).parent
 
 async def main() -> None:
     """Main entry point."""
+    parser = _build_parser()
+    args = parser.parse_args()
+
+    # Validate args
+    if (not args.mic_uri) and (not args.mic_command):
+        _LOGGER.fatal("Either --mic-uri or --mic-command is required")
+        sys.exit(1)
+
+    if needs_webrtc(args):
+        try:
+            import webrtc_noise_gain  # noqa: F401
+        except ImportError:
+            _LOGGER.exception("Extras for webrtc are not installed")
+            sys.exit(1)
+
+    if needs_silero(args):
+        try:
+            import pysilero_vad  # noqa: F401
+        except ImportError:
+            _LOGGER.exception("Extras for silerovad are not installed")
+            sys.exit(1)
+
+    if args.awake_wav and (not Path(args.awake_wav).is_file()):
+        _LOGGER.fatal("%s does not exist", args.awake_wav)
+        sys.exit(1)
+
+    if args.done_wav and (not Path(args.done_wav).is_file()):
+        _LOGGER.fatal("%s does not exist", args.done_wav)
+        sys.exit(1)
+
+    if args.timer_finished_wav and (not Path(args.timer_finished_wav).is_file()):
+        _LOGGER.fatal("%s does not exist", args.timer_finished_wav)
+        sys.exit(1)
+
+    if args.vad and (args.wake_uri or args.wake_command):
+        _LOGGER.warning("VAD is not used with local wake word detection")
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO, format=args.log_format
+    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        # Only log arguments that were changed from their defaults
+        _LOGGER.debug(
+            "Arguments: %s",
+            {
+                arg_name: arg_value
+                for arg_name, arg_value in vars(args).items()
+                if arg_value != parser.get_default(arg_name)
+            },
+        )
+
+    if args.debug_recording_dir:
+        args.debug_recording_dir = Path(args.debug_recording_dir)
+        _LOGGER.info("Recording audio to %s", args.debug_recording_dir)
+
+    wyoming_info = Info(
+        satellite=Satellite(
+            name=args.name,
+            area=args.area,
+            description=args.name,
+            attribution=Attribution(name="", url=""),
+            installed=True,
+            version=__version__,
+        )
+    )
+
+    settings = SatelliteSettings(
+        mic=MicSettings(
+            uri=args.mic_uri,
+            command=split_command(args.mic_command),
+            rate=args.mic_command_rate,
+            width=args.mic_command_width,
+            channels=args.mic_command_channels,
+            samples_per_chunk=args.mic_command_samples_per_chunk,
+            volume_multiplier=args.mic_volume_multiplier,
+            auto_gain=args.mic_auto_gain,
+            noise_suppression=args.mic_noise_suppression,
+            seconds_to_mute_after_awake_wav=args.mic_seconds_to_mute_after_awake_wav,
+            mute_during_awake_wav=(not args.mic_no_mute_during_awake_wav),
+            channel_index=args.mic_channel_index,
+        ),
+        vad=VadSettings(
+            enabled=args.vad,
+            threshold=args.vad_threshold,
+            trigger_level=args.vad_trigger_level,
+            buffer_seconds=args.vad_buffer_seconds,
+            wake_word_timeout=args.vad_wake_word_timeout,
+        ),
+        wake=WakeSettings(
+            uri=args.wake_uri,
+            command=split_command(args.wake_command),
+            names=[
+                WakeWordAndPipeline(*wake_name) for wake_name in args.wake_word_name
+            ],
+            refractory_seconds=(
+                args.wake_refractory_seconds
+                if args.wake_refractory_seconds > 0
+                else None
+            ),
+        ),
+        snd=SndSettings(
+            uri=args.snd_uri,
+            command=split_command(args.snd_command),
+            rate=args.snd_command_rate,
+            width=args.snd_command_width,
+            channels=args.snd_command_channels,
+            volume_multiplier=args.snd_volume_multiplier,
+            awake_wav=args.awake_wav,
+            done_wav=args.done_wav,
+        ),
+        event=EventSettings(
+            uri=args.event_uri,
+            startup=split_command(args.startup_command),
+            streaming_start=split_command(args.streaming_start_command),
+            streaming_stop=split_command(args.streaming_stop_command),
+            detect=split_command(args.detect_command),
+            detection=split_command(args.detection_command),
+            played=split_command(args.tts_played_command),
+            transcript=split_command(args.transcript_command),
+            stt_start=split_command(args.stt_start_command),
+            stt_stop=split_command(args.stt_stop_command),
+            synthesize=split_command(args.synthesize_command),
+            tts_start=split_command(args.tts_start_command),
+            tts_stop=split_command(args.tts_stop_command),
+            error=split_command(args.error_command),
+            connected=split_command(args.connected_command),
+            disconnected=split_command(args.disconnected_command),
+            persistent_commands=args.persistent_event_commands,
+        ),
+        timer=TimerSettings(
+            started=split_command(args.timer_started_command),
+            updated=split_command(args.timer_updated_command),
+            cancelled=split_command(args.timer_cancelled_command),
+            finished=split_command(args.timer_finished_command),
+            finished_wav=args.timer_finished_wav,
+            finished_wav_plays=int(args.timer_finished_wav_repeat[0]),
+            finished_wav_delay=args.timer_finished_wav_repeat[1],
+        ),
+        debug_recording_dir=args.debug_recording_dir,
+    )
+
+    satellite: SatelliteBase
+
+    if settings.wake.enabled:
+        # Local wake word detection
+        satellite = WakeStreamingSatellite(settings)
+    elif settings.vad.enabled:
+        # Stream after speech
+        satellite = VadStreamingSatellite(settings)
+    else:
+        # Stream all the time
+        satellite = AlwaysStreamingSatellite(settings)
+
+    if settings.event.startup:
+        await run_event_command(settings.event.startup)
+
+    _LOGGER.info("Ready")
+
+    # Start server
+    server = AsyncServer.from_uri(args.uri)
+
+    # Shut down cleanly when stopped by systemd (SIGTERM) instead of exiting
+    # with the satellite's subprocesses still running.
+    main_task = asyncio.current_task()
+    assert main_task is not None
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, main_task.cancel)
+
+    satellite_task: "Optional[asyncio.Task[None]]" = None
+    try:
+        # Created inside try so the satellite is always stopped and awaited
+        satellite_task = asyncio.create_task(satellite.run(), name="satellite run")
+
+        # Registered after the satellite task is created so the mDNS
+        # announcement doesn't hold up connecting to the microphone.
+        if (not args.no_zeroconf) and isinstance(server, AsyncTcpServer):
+            from wyoming.zeroconf import register_server
+
+            if not args.zeroconf_name:
+                args.zeroconf_name = get_mac_address()
+
+            tcp_server: AsyncTcpServer = server
+            await register_server(
+                name=args.zeroconf_name,
+                port=tcp_server.port,
+                host=args.zeroconf_host,
+            )
+            _LOGGER.debug(
+                "Zeroconf discovery enabled (name=%s, host=%s)",
+                args.zeroconf_name,
+                args.zeroconf_host,
+            )
+
+        await server.run(partial(SatelliteEventHandler, wyoming_info, satellite, args))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    finally:
+        await satellite.stop()
+        if satellite_task is not None:
+            await satellite_task
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Create the command-line argument parser."""
     parser = argparse.ArgumentParser()
 
     # Microphone input
@@ -227,6 +432,11 @@ async def main() -> None:
         "--disconnected-command",
         help="Command to run when disconnected from the server",
     )
+    parser.add_argument(
+        "--persistent-event-commands",
+        action="store_true",
+        help="Keep event commands running and send one line per event on stdin",
+    )
     parser.add_argument(
         "--timer-started-command",
         help="Command to run when a timer starts",
@@ -297,183 +507,8 @@ async def main() -> None:
         version=__version__,
         help="Print version and exit",
     )
-    args = parser.parse_args()
-
-    # Validate args
-    if (not args.mic_uri) and (not args.mic_command):
-        _LOGGER.fatal("Either --mic-uri or --mic-command is required")
-        sys.exit(1)
-
-    if needs_webrtc(args):
-        try:
-            import webrtc_noise_gain  # noqa: F401
-        except ImportError:
-            _LOGGER.exception("Extras for webrtc are not installed")
-            sys.exit(1)
-
-    if needs_silero(args):
-        try:
-            import pysilero_vad  # noqa: F401
-        except ImportError:
-            _LOGGER.exception("Extras for silerovad are not installed")
-            sys.exit(1)
-
-    if args.awake_wav and (not Path(args.awake_wav).is_file()):
-        _LOGGER.fatal("%s does not exist", args.awake_wav)
-        sys.exit(1)
-
-    if args.done_wav and (not Path(args.done_wav).is_file()):
-        _LOGGER.fatal("%s does not exist", args.done_wav)
-        sys.exit(1)
-
-    if args.timer_finished_wav and (not Path(args.timer_finished_wav).is_file()):
-        _LOGGER.fatal("%s does not exist", args.timer_finished_wav)
-        sys.exit(1)
-
-    if args.vad and (args.wake_uri or args.wake_command):
-        _LOGGER.warning("VAD is not used with local wake word detection")
-
-    logging.basicConfig(
-        level=logging.DEBUG if args.debug else logging.INFO, format=args.log_format
-    )
-    _LOGGER.debug(args)
-
-    if args.debug_recording_dir:
-        args.debug_recording_dir = Path(args.debug_recording_dir)
-        _LOGGER.info("Recording audio to %s", args.debug_recording_dir)
-
-    wyoming_info = Info(
-        satellite=Satellite(
-            name=args.name,
-            area=args.area,
-            description=args.name,
-            attribution=Attribution(name="", url=""),
-            installed=True,
-            version=__version__,
-        )
-    )
-
-    settings = SatelliteSettings(
-        mic=MicSettings(
-            uri=args.mic_uri,
-            command=split_command(args.mic_command),
-            rate=args.mic_command_rate,
-            width=args.mic_command_width,
-            channels=args.mic_command_channels,
-            samples_per_chunk=args.mic_command_samples_per_chunk,
-            volume_multiplier=args.mic_volume_multiplier,
-            auto_gain=args.mic_auto_gain,
-            noise_suppression=args.mic_noise_suppression,
-            seconds_to_mute_after_awake_wav=args.mic_seconds_to_mute_after_awake_wav,
-            mute_during_awake_wav=(not args.mic_no_mute_during_awake_wav),
-            channel_index=args.mic_channel_index,
-        ),
-        vad=VadSettings(
-            enabled=args.vad,
-            threshold=args.vad_threshold,
-            trigger_level=args.vad_trigger_level,
-            buffer_seconds=args.vad_buffer_seconds,
-            wake_word_timeout=args.vad_wake_word_timeout,
-        ),
-        wake=WakeSettings(
-            uri=args.wake_uri,
-            command=split_command(args.wake_command),
-            names=[
-                WakeWordAndPipeline(*wake_name) for wake_name in args.wake_word_name
-            ],
-            refractory_seconds=(
-                args.wake_refractory_seconds
-                if args.wake_refractory_seconds > 0
-                else None
-            ),
-        ),
-        snd=SndSettings(
-            uri=args.snd_uri,
-            command=split_command(args.snd_command),
-            rate=args.snd_command_rate,
-            width=args.snd_command_width,
-            channels=args.snd_command_channels,
-            volume_multiplier=args.snd_volume_multiplier,
-            awake_wav=args.awake_wav,
-            done_wav=args.done_wav,
-        ),
-        event=EventSettings(
-            uri=args.event_uri,
-            startup=split_command(args.startup_command),
-            streaming_start=split_command(args.streaming_start_command),
-            streaming_stop=split_command(args.streaming_stop_command),
-            detect=split_command(args.detect_command),
-            detection=split_command(args.detection_command),
-            played=split_command(args.tts_played_command),
-            transcript=split_command(args.transcript_command),
-            stt_start=split_command(args.stt_start_command),
-            stt_stop=split_command(args.stt_stop_command),
-            synthesize=split_command(args.synthesize_command),
-            tts_start=split_command(args.tts_start_command),
-            tts_stop=split_command(args.tts_stop_command),
-            error=split_command(args.error_command),
-            connected=split_command(args.connected_command),
-            disconnected=split_command(args.disconnected_command),
-        ),
-        timer=TimerSettings(
-            started=split_command(args.timer_started_command),
-            updated=split_command(args.timer_updated_command),
-            cancelled=split_command(args.timer_cancelled_command),
-            finished=split_command(args.timer_finished_command),
-            finished_wav=args.timer_finished_wav,
-            finished_wav_plays=int(args.timer_finished_wav_repeat[0]),
-            finished_wav_delay=args.timer_finished_wav_repeat[1],
-        ),
-        debug_recording_dir=args.debug_recording_dir,
-    )
-
-    satellite: SatelliteBase
-
-    if settings.wake.enabled:
-        # Local wake word detection
-        satellite = WakeStreamingSatellite(settings)
-    elif settings.vad.enabled:
-        # Stream after speech
-        satellite = VadStreamingSatellite(settings)
-    else:
-        # Stream all the time
-        satellite = AlwaysStreamingSatellite(settings)
-
-    if args.startup_command:
-        await run_event_command(split_command(args.startup_command))
-
-    _LOGGER.info("Ready")
-
-    # Start server
-    server = AsyncServer.from_uri(args.uri)
-
-    if (not args.no_zeroconf) and isinstance(server, AsyncTcpServer):
-        from wyoming.zeroconf import register_server
-
-        if not args.zeroconf_name:
-            args.zeroconf_name = get_mac_address()
-
-        tcp_server: AsyncTcpServer = server
-        await register_server(
-            name=args.zeroconf_name,
-            port=tcp_server.port,
-            host=args.zeroconf_host,
-        )
-        _LOGGER.debug(
-            "Zeroconf discovery enabled (name=%s, host=%s)",
-            args.zeroconf_name,
-            args.zeroconf_host,
-        )
 
-    satellite_task = asyncio.create_task(satellite.run(), name="satellite run")
-
-    try:
-        await server.run(partial(SatelliteEventHandler, wyoming_info, satellite, args))
-    except KeyboardInterrupt:
-        pass
-    finally:
-        await satellite.stop()
-        await satellite_task
+    return parser
 
 
 # -----------------------------------------------------------------------------
@@ -4,18 +4,16 @@ import asyncio
 import logging
 import math
 import time
-import wave
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
-from typing import Callable, Dict, Final, List, Optional, Set, Union
+from typing import Awaitable, Callable, Dict, Final, List, Optional, Tuple, Type, Union
 
-from pyring_buffer import RingBuffer
 from wyoming.asr import Transcript
 from wyoming.audio import AudioChunk, AudioFormat, AudioStart, AudioStop
 from wyoming.client import AsyncClient
 from wyoming.error import Error
-from wyoming.event import Event, async_write_event
+from wyoming.event import Event, Eventable, async_write_event
 from wyoming.info import Describe, Info
 from wyoming.mic import MicProcessAsyncClient
 from wyoming.ping import Ping, Pong
@@ -36,9 +34,13 @@ from wyoming.wake import Detect, Detection, WakeProcessAsyncClient
 
 from .settings import SatelliteSettings
 from .utils import (
+    AudioRingBuffer,
     DebugAudioWriter,
+    PersistentEventCommands,
+    coalesce_audio_events,
     multiply_volume,
     normalize_wake_word,
+    read_wav,
     run_event_command,
     wav_to_events,
 )
@@ -50,6 +52,14 @@ _LOGGER = logging.getLogger()
 _PONG_TIMEOUT: Final = 5
 _PING_SEND_DELAY: Final = 2
 _WAKE_INFO_TIMEOUT: Final = 2
+_MAX_WAKE_BATCH: Final = 8
+_EVENT_COMMAND_DRAIN_TIMEOUT: Final = 5
+
+# Handles an event from the server, returning True if it should be forwarded
+_ServerHandler = Callable[[Event], Awaitable[bool]]
+
+# Event command with its input (text or event)
+_EventCommand = Tuple[List[str], Optional[Union[str, Eventable]]]
 
 
 class State(Enum):
@@ -85,7 +95,7 @@ class SatelliteBase:
         self._snd_task: Optional[asyncio.Task] = None
         self._snd_queue: "Optional[asyncio.Queue[SoundEvent]]" = None
         self._wake_task: Optional[asyncio.Task] = None
-        self._wake_queue: "Optional[asyncio.Queue[Event]]" = None
+        self._wake_queue: "Optional[asyncio.Queue[Optional[Event]]]" = None
         self._event_task: Optional[asyncio.Task] = None
         self._event_queue: "Optional[asyncio.Queue[Event]]" = None
 
@@ -93,9 +103,19 @@ class SatelliteBase:
         self._pong_received_event = asyncio.Event()
         self._ping_server_task: Optional[asyncio.Task] = None
 
+        # Event type -> handler (None if unhandled), filled in as types are seen
+        self._server_handlers: Dict[str, Optional[_ServerHandler]] = {}
+
         self.microphone_muted = False
         self._unmute_microphone_task: Optional[asyncio.Task] = None
 
+        # Event commands are run in order by a background task
+        self._event_command_task: Optional[asyncio.Task] = None
+        self._event_command_queue: "asyncio.Queue[_EventCommand]" = asyncio.Queue()
+        self._persistent_event_commands: Optional[PersistentEventCommands] = None
+        if settings.event.persistent_commands:
+            self._persistent_event_commands = PersistentEventCommands()
+
         # Debug audio recording
         self.wake_audio_writer: Optional[DebugAudioWriter] = None
         self.stt_audio_writer: Optional[DebugAudioWriter] = None
@@ -128,6 +148,13 @@ class SatelliteBase:
 
     async def run(self) -> None:
         """Run main satellite loop."""
+        if (self._event_command_task is None) and (
+            self.settings.event.has_commands or self.settings.timer.has_commands
+        ):
+            # Runs until the satellite is stopped, across restarts
+            self._event_command_task = asyncio.create_task(
+                self._event_command_task_proc(), name="event_command"
+            )
 
         while self.is_running:
             try:
@@ -243,6 +270,8 @@ class SatelliteBase:
 
         await self._disconnect_from_services()
         self._disable_ping()
+        await self._stop_event_commands()
+
         self.state = State.STOPPED
 
     async def stopped(self) -> None:
@@ -250,76 +279,139 @@ class SatelliteBase:
 
     async def event_from_server(self, event: Event) -> None:
         """Called when an event is received from the server."""
-        forward_event = True
+        try:
+            handler = self._server_handlers[event.type]
+        except KeyError:
+            handler = self._find_server_handler(event.type)
+            self._server_handlers[event.type] = handler
 
-        if Ping.is_type(event.type):
-            # Respond with pong
-            ping = Ping.from_event(event)
-            await self.event_to_server(Pong(text=ping.text).event())
-
-            if not self._ping_server_enabled:
-                # Enable pinging
-                self._enable_ping()
-                _LOGGER.debug("Ping enabled")
-
-            forward_event = False
-        elif Pong.is_type(event.type):
-            # Response from our ping
-            self._pong_received_event.set()
-            forward_event = False
-        elif AudioChunk.is_type(event.type):
-            # TTS audio
-            await self.event_to_snd(event)
-            forward_event = False
-        elif AudioStart.is_type(event.type):
-            # TTS started
-            await self.event_to_snd(event)
-            await self.trigger_tts_start()
-        elif AudioStop.is_type(event.type):
-            # TTS stopped
-            await self.event_to_snd(event)
-            await self.trigger_tts_stop()
-        elif Detect.is_type(event.type):
-            # Wake word detection started
-            await self.trigger_detect()
-        elif Detection.is_type(event.type):
-            # Wake word detected
-            _LOGGER.debug("Wake word detected")
-            await self.trigger_detection(Detection.from_event(event))
-        elif VoiceStarted.is_type(event.type):
-            # STT start
-            await self.trigger_stt_start()
-        elif VoiceStopped.is_type(event.type):
-            # STT stop
-            await self.trigger_stt_stop()
-        elif Transcript.is_type(event.type):
-            # STT text
-            _LOGGER.debug(event)
-            await self.trigger_transcript(Transcript.from_event(event))
-        elif Synthesize.is_type(event.type):
-            # TTS request
-            _LOGGER.debug(event)
-            await self.trigger_synthesize(Synthesize.from_event(event))
-        elif Error.is_type(event.type):
-            _LOGGER.warning(event)
-            await self.trigger_error(Error.from_event(event))
-        elif TimerStarted.is_type(event.type):
-            _LOGGER.debug(event)
-            await self.trigger_timer_started(TimerStarted.from_event(event))
-        elif TimerUpdated.is_type(event.type):
-            _LOGGER.debug(event)
-            await self.trigger_timer_updated(TimerUpdated.from_event(event))
-        elif TimerCancelled.is_type(event.type):
-            _LOGGER.debug(event)
-            await self.trigger_timer_cancelled(TimerCancelled.from_event(event))
-        elif TimerFinished.is_type(event.type):
-            _LOGGER.debug(event)
-            await self.trigger_timer_finished(TimerFinished.from_event(event))
+        forward_event = True
+        if handler is not None:
+            forward_event = await handler(event)
 
         # Forward everything except audio/ping/pong to event service
         if forward_event:
             await self.forward_event(event)
 
+    def _find_server_handler(self, event_type: str) -> Optional[_ServerHandler]:
+        """Look up the handler for a server event type (None if unhandled)."""
+        handlers: List[Tuple[Type[Eventable], _ServerHandler]] = [
+            (Ping, self._server_ping),
+            (Pong, self._server_pong),
+            (AudioChunk, self._server_audio_chunk),
+            (AudioStart, self._server_audio_start),
+            (AudioStop, self._server_audio_stop),
+            (Detect, self._server_detect),
+            (Detection, self._server_detection),
+            (VoiceStarted, self._server_voice_started),
+            (VoiceStopped, self._server_voice_stopped),
+            (Transcript, self._server_transcript),
+            (Synthesize, self._server_synthesize),
+            (Error, self._server_error),
+            (TimerStarted, self._server_timer_started),
+            (TimerUpdated, self._server_timer_updated),
+            (TimerCancelled, self._server_timer_cancelled),
+            (TimerFinished, self._server_timer_finished),
+        ]
+
+        for eventable_type, handler in handlers:
+            if eventable_type.is_type(event_type):
+                return handler
+
+        return None
+
+    async def _server_ping(self, event: Event) -> bool:
+        # Respond with pong
+        ping = Ping.from_event(event)
+        await self.event_to_server(Pong(text=ping.text).event())
+
+        if not self._ping_server_enabled:
+            # Enable pinging
+            self._enable_ping()
+            _LOGGER.debug("Ping enabled")
+
+        return False
+
+    async def _server_pong(self, event: Event) -> bool:
+        # Response from our ping
+        self._pong_received_event.set()
+        return False
+
+    async def _server_audio_chunk(self, event: Event) -> bool:
+        # TTS audio
+        await self.event_to_snd(event)
+        return False
+
+    async def _server_audio_start(self, event: Event) -> bool:
+        # TTS started
+        await self.event_to_snd(event)
+        await self.trigger_tts_start()
+        return True
+
+    async def _server_audio_stop(self, event: Event) -> bool:
+        # TTS stopped
+        await self.event_to_snd(event)
+        await self.trigger_tts_stop()
+        return True
+
+    async def _server_detect(self, event: Event) -> bool:
+        # Wake word detection started
+        await self.trigger_detect()
+        return True
+
+    async def _server_detection(self, event: Event) -> bool:
+        # Wake word detected
+        _LOGGER.debug("Wake word detected")
+        await self.trigger_detection(Detection.from_event(event))
+        return True
+
+    async def _server_voice_started(self, event: Event) -> bool:
+        # STT start
+        await self.trigger_stt_start()
+        return True
+
+    async def _server_voice_stopped(self, event: Event) -> bool:
+        # STT stop
+        await self.trigger_stt_stop()
+        return True
+
+    async def _server_transcript(self, event: Event) -> bool:
+        # STT text
+        _LOGGER.debug(event)
+        await self.trigger_transcript(Transcript.from_event(event))
+        return True
+
+    async def _server_synthesize(self, event: Event) -> bool:
+        # TTS request
+        _LOGGER.debug(event)
+        await self.trigger_synthesize(Synthesize.from_event(event))
+        return True
+
+    async def _server_error(self, event: Event) -> bool:
+        _LOGGER.warning(event)
+        await self.trigger_error(Error.from_event(event))
+        return True
+
+    async def _server_timer_started(self, event: Event) -> bool:
+        _LOGGER.debug(event)
+        await self.trigger_timer_started(TimerStarted.from_event(event))
+        return True
+
+    async def _server_timer_updated(self, event: Event) -> bool:
+        _LOGGER.debug(event)
+        await self.trigger_timer_updated(TimerUpdated.from_event(event))
+        return True
+
+    async def _server_timer_cancelled(self, event: Event) -> bool:
+        _LOGGER.debug(event)
+        await self.trigger_timer_cancelled(TimerCancelled.from_event(event))
+        return True
+
+    async def _server_timer_finished(self, event: Event) -> bool:
+        _LOGGER.debug(event)
+        await self.trigger_timer_finished(TimerFinished.from_event(event))
+        return True
+
     async def _send_run_pipeline(self, pipeline_name: Optional[str] = None) -> None:
         """Sends a RunPipeline event with the correct stages."""
         if self.settings.wake.enabled:
@@ -463,6 +555,10 @@ class SatelliteBase:
                 self.settings.mic.auto_gain, self.settings.mic.noise_suppression
             )
 
+        # Settings are frozen, so look these up once instead of per chunk
+        needs_processing = self.settings.mic.needs_processing
+        channel_index = self.settings.mic.channel_index
+
         async def _disconnect() -> None:
             try:
                 if mic_client is not None:
@@ -487,38 +583,39 @@ class SatelliteBase:
                     continue
 
                 # Audio processing
-                if (
-                    self.settings.mic.needs_processing
-                    or (self.settings.mic.channel_index is not None)
-                    and AudioChunk.is_type(event.type)
+                if (needs_processing or (channel_index is not None)) and (
+                    AudioChunk.is_type(event.type)
                 ):
-                    chunk = AudioChunk.from_event(event)
-                    if self.settings.mic.channel_index is not None:
+                    # Raw PCM is the event payload
+                    raw_audio = event.payload or bytes()
+                    mic_audio: bytes = raw_audio
+                    if channel_index is not None:
+                        # Header is only needed for channel selection
+                        chunk = AudioChunk.from_event(event)
                         if chunk.width != 2:
                             raise ValueError(
                                 "Mic channel index selection requires 16-bit samples"
                             )
 
                         # Convert to unsigned 16-bit array to make channel extraction easier
-                        audio_array = array.array("H", chunk.audio)
-                        audio_bytes = audio_array[
-                            self.settings.mic.channel_index :: chunk.channels
+                        audio_array = array.array("H", raw_audio)
+                        mic_audio = audio_array[
+                            channel_index :: chunk.channels
                         ].tobytes()
 
-                    if self.settings.mic.needs_processing:
-                        if audio_bytes is None:
-                            audio_bytes = chunk.audio
-
-                        audio_bytes = self._process_mic_audio(chunk.audio)
-
-                    event = AudioChunk(
-                        rate=chunk.rate,
-                        width=chunk.width,
-                        channels=chunk.channels
-                        if (self.settings.mic.channel_index is None)
-                        else 1,
-                        audio=audio_bytes,
-                    ).event()
+                    if needs_processing:
+                        mic_audio = self._process_mic_audio(mic_audio)
+
+                    audio_bytes = mic_audio
+                    if audio_bytes is not raw_audio:
+                        # Reuse the original header instead of re-building the chunk
+                        event = Event(
+                            type=event.type,
+                            data=event.data
+                            if (channel_index is None)
+                            else {**event.data, "channels": 1},
+                            payload=audio_bytes,
+                        )
                 else:
                     audio_bytes = None
 
@@ -576,6 +673,9 @@ class SatelliteBase:
         """Snd service loop."""
         snd_client: Optional[AsyncClient] = None
 
+        # Settings are frozen, so look this up once instead of per event
+        needs_processing = self.settings.snd.needs_processing
+
         async def _disconnect() -> None:
             try:
                 if snd_client is not None:
@@ -598,17 +698,15 @@ class SatelliteBase:
                     _LOGGER.debug("Connected to snd service")
 
                 # Audio processing
-                if self.settings.snd.needs_processing and AudioChunk.is_type(
-                    event.type
-                ):
-                    chunk = AudioChunk.from_event(event)
-                    audio_bytes = self._process_snd_audio(chunk.audio)
-                    event = AudioChunk(
-                        rate=chunk.rate,
-                        width=chunk.width,
-                        channels=chunk.channels,
-                        audio=audio_bytes,
-                    ).event()
+                if needs_processing and AudioChunk.is_type(event.type):
+                    # Raw PCM is the event payload
+                    snd_audio = event.payload or bytes()
+                    audio_bytes = self._process_snd_audio(snd_audio)
+                    if audio_bytes is not snd_audio:
+                        # Reuse the original header instead of re-building the chunk
+                        event = Event(
+                            type=event.type, data=event.data, payload=audio_bytes
+                        )
 
                 await snd_client.write_event(event)
 
@@ -648,8 +746,8 @@ class SatelliteBase:
 
         try:
             if mute_microphone:
-                with wave.open(str(wav_path), "rb") as wav_file:
-                    seconds_to_mute = wav_file.getnframes() / wav_file.getframerate()
+                rate, width, channels, audio = read_wav(wav_path)
+                seconds_to_mute = len(audio) / (rate * width * channels)
 
                 seconds_to_mute += self.settings.mic.seconds_to_mute_after_awake_wav
                 _LOGGER.debug("Muting microphone for %s second(s)", seconds_to_mute)
@@ -706,21 +804,15 @@ class SatelliteBase:
     async def _wake_task_proc(self) -> None:
         """Wake service loop."""
         wake_client: Optional[AsyncClient] = None
-        to_client_task: Optional[asyncio.Task] = None
         from_client_task: Optional[asyncio.Task] = None
-        pending: Set[asyncio.Task] = set()
 
         async def _disconnect() -> None:
-            nonlocal to_client_task, from_client_task
+            nonlocal from_client_task
             try:
                 if wake_client is not None:
                     await wake_client.disconnect()
 
                 # Clean up tasks
-                if to_client_task is not None:
-                    to_client_task.cancel()
-                    to_client_task = None
-
                 if from_client_task is not None:
                     from_client_task.cancel()
                     from_client_task = None
@@ -739,54 +831,38 @@ class SatelliteBase:
                     _LOGGER.debug("Connected to wake service")
 
                     # Reset
-                    from_client_task = None
-                    to_client_task = None
-                    pending = set()
                     self._wake_queue = asyncio.Queue()
 
-                    # Inform wake service of which wake word(s) to detect
-                    await self._send_wake_detect()
-
-                # Read/write in "parallel"
-                if to_client_task is None:
-                    # From satellite to wake service
-                    to_client_task = asyncio.create_task(
-                        self._wake_queue.get(), name="wake_to_client"
-                    )
-                    pending.add(to_client_task)
-
-                if from_client_task is None:
                     # From wake service to satellite
                     from_client_task = asyncio.create_task(
-                        wake_client.read_event(), name="wake_from_client"
+                        self._wake_from_client(wake_client, self._wake_queue),
+                        name="wake_from_client",
                     )
-                    pending.add(from_client_task)
 
-                done, pending = await asyncio.wait(
-                    pending, return_when=asyncio.FIRST_COMPLETED
-                )
+                    # Inform wake service of which wake word(s) to detect
+                    await self._send_wake_detect()
 
-                if to_client_task in done:
-                    # Event to go to wake service (audio)
-                    assert to_client_task is not None
-                    event = to_client_task.result()
-                    to_client_task = None
-                    await wake_client.write_event(event)
-
-                if from_client_task in done:
-                    # Event from wake service (detection)
-                    assert from_client_task is not None
-                    event = from_client_task.result()
-                    from_client_task = None
+                # From satellite to wake service (audio).
+                # Audio that queued up meanwhile is drained so it goes out in
+                # fewer, larger writes.
+                events: List[Event] = []
+                event = await self._wake_queue.get()
+                while event is not None:
+                    events.append(event)
+                    if (len(events) >= _MAX_WAKE_BATCH) or self._wake_queue.empty():
+                        break
 
-                    if event is None:
-                        _LOGGER.warning("Wake service disconnected")
-                        await _disconnect()
-                        wake_client = None  # reconnect
-                        await asyncio.sleep(self.settings.wake.reconnect_seconds)
-                        continue
+                    event = self._wake_queue.get_nowait()
+
+                for event_to_write in coalesce_audio_events(events):
+                    await wake_client.write_event(event_to_write)
 
-                    await self.event_from_wake(event)
+                if event is None:
+                    # Reader lost the wake service
+                    await _disconnect()
+                    wake_client = None  # reconnect
+                    await asyncio.sleep(self.settings.wake.reconnect_seconds)
+                    continue
 
             except asyncio.CancelledError:
                 break
@@ -798,6 +874,38 @@ class SatelliteBase:
 
         await _disconnect()
 
+    async def _wake_from_client(
+        self, wake_client: AsyncClient, wake_queue: "asyncio.Queue[Optional[Event]]"
+    ) -> None:
+        """Pass events from the wake service (detections) to the satellite.
+
+        Puts None in the wake queue when the wake service goes away.
+        """
+        while True:
+            try:
+                event = await wake_client.read_event()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                _LOGGER.exception("Unexpected error reading from wake service")
+                break
+
+            if event is None:
+                _LOGGER.warning("Wake service disconnected")
+                break
+
+            # Handling isn't interrupted if the reader is cancelled on disconnect
+            await asyncio.shield(self._handle_wake_event(event))
+
+        wake_queue.put_nowait(None)
+
+    async def _handle_wake_event(self, event: Event) -> None:
+        """Handle an event from the wake service, logging any errors."""
+        try:
+            await self.event_from_wake(event)
+        except Exception:
+            _LOGGER.exception("Unexpected error handling wake event")
+
     async def _send_wake_detect(self) -> None:
         """Inform wake word service of which wake words to detect."""
         wake_names: Optional[List[str]] = None
@@ -811,35 +919,83 @@ class SatelliteBase:
     # Events
     # -------------------------------------------------------------------------
 
+    async def _run_event_command(
+        self,
+        command: Optional[List[str]],
+        command_input: Optional[Union[str, Eventable]] = None,
+    ) -> None:
+        """Queue an event command to be run in the background."""
+        if not command:
+            return
+
+        self._event_command_queue.put_nowait((command, command_input))
+
+    async def _event_command_task_proc(self) -> None:
+        """Run queued event commands in order."""
+        while True:
+            command, command_input = await self._event_command_queue.get()
+            try:
+                if self._persistent_event_commands is not None:
+                    # Send input to the running command
+                    await self._persistent_event_commands.run(command, command_input)
+                else:
+                    await run_event_command(command, command_input)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                _LOGGER.exception("Unexpected error running event command")
+            finally:
+                self._event_command_queue.task_done()
+
+    async def _stop_event_commands(self) -> None:
+        """Let queued event commands finish, then stop the background task."""
+        if self._event_command_task is not None:
+            try:
+                await asyncio.wait_for(
+                    self._event_command_queue.join(),
+                    timeout=_EVENT_COMMAND_DRAIN_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                _LOGGER.warning(
+                    "Event commands did not finish within %s second(s)",
+                    _EVENT_COMMAND_DRAIN_TIMEOUT,
+                )
+
+            self._event_command_task.cancel()
+            self._event_command_task = None
+
+        if self._persistent_event_commands is not None:
+            await self._persistent_event_commands.close()
+
     async def trigger_server_connected(self) -> None:
         """Called when connected to server."""
         _LOGGER.info("Connected to server")
-        await run_event_command(self.settings.event.connected)
+        await self._run_event_command(self.settings.event.connected)
         await self.forward_event(SatelliteConnected().event())
 
     async def trigger_server_disonnected(self) -> None:
         """Called when disconnected from server."""
         _LOGGER.info("Disconnected from server")
-        await run_event_command(self.settings.event.disconnected)
+        await self._run_event_command(self.settings.event.disconnected)
         await self.forward_event(SatelliteDisconnected().event())
 
     async def trigger_streaming_start(self) -> None:
         """Called when audio streaming starts."""
-        await run_event_command(self.settings.event.streaming_start)
+        await self._run_event_command(self.settings.event.streaming_start)
         await self.forward_event(StreamingStarted().event())
 
     async def trigger_streaming_stop(self) -> None:
         """Called when audio streaming stops."""
-        await run_event_command(self.settings.event.streaming_stop)
+        await self._run_event_command(self.settings.event.streaming_stop)
         await self.forward_event(StreamingStopped().event())
 
     async def trigger_detect(self) -> None:
         """Called when wake word detection starts."""
-        await run_event_command(self.settings.event.detect)
+        await self._run_event_command(self.settings.event.detect)
 
     async def trigger_detection(self, detection: Detection) -> None:
         """Called when wake word is detected."""
-        await run_event_command(self.settings.event.detection, detection.name)
+        await self._run_event_command(self.settings.event.detection, detection.name)
         await self._play_wav(
             self.settings.snd.awake_wav,
             mute_microphone=self.settings.mic.mute_during_awake_wav,
@@ -847,53 +1003,53 @@ class SatelliteBase:
 
     async def trigger_played(self) -> None:
         """Called when audio stopped playing"""
-        await run_event_command(self.settings.event.played)
+        await self._run_event_command(self.settings.event.played)
         await self.forward_event(Played().event())
 
     async def trigger_transcript(self, transcript: Transcript) -> None:
         """Called when speech-to-text text is received."""
-        await run_event_command(self.settings.event.transcript, transcript.text)
+        await self._run_event_command(self.settings.event.transcript, transcript.text)
         await self._play_wav(self.settings.snd.done_wav)
 
     async def trigger_stt_start(self) -> None:
         """Called when user starts speaking."""
-        await run_event_command(self.settings.event.stt_start)
+        await self._run_event_command(self.settings.event.stt_start)
 
     async def trigger_stt_stop(self) -> None:
         """Called when user stops speaking."""
-        await run_event_command(self.settings.event.stt_stop)
+        await self._run_event_command(self.settings.event.stt_stop)
 
     async def trigger_synthesize(self, synthesize: Synthesize) -> None:
         """Called when text-to-speech text is received."""
-        await run_event_command(self.settings.event.synthesize, synthesize.text)
+        await self._run_event_command(self.settings.event.synthesize, synthesize.text)
 
     async def trigger_tts_start(self) -> None:
         """Called when text-to-speech audio starts."""
-        await run_event_command(self.settings.event.tts_start)
+        await self._run_event_command(self.settings.event.tts_start)
 
     async def trigger_tts_stop(self) -> None:
         """Called when text-to-speech audio stops."""
-        await run_event_command(self.settings.event.tts_stop)
+        await self._run_event_command(self.settings.event.tts_stop)
 
     async def trigger_error(self, error: Error) -> None:
         """Called when an error occurs on the server."""
-        await run_event_command(self.settings.event.error, error.text)
+        await self._run_event_command(self.settings.event.error, error.text)
 
     async def trigger_timer_started(self, timer_started: TimerStarted) -> None:
         """Called when timer-started event is received."""
-        await run_event_command(self.settings.timer.started, timer_started)
+        await self._run_event_command(self.settings.timer.started, timer_started)
 
     async def trigger_timer_updated(self, timer_updated: TimerUpdated) -> None:
         """Called when timer-updated event is received."""
-        await run_event_command(self.settings.timer.updated, timer_updated)
+        await self._run_event_command(self.settings.timer.updated, timer_updated)
 
     async def trigger_timer_cancelled(self, timer_cancelled: TimerCancelled) -> None:
         """Called when timer-cancelled event is received."""
-        await run_event_command(self.settings.timer.cancelled, timer_cancelled.id)
+        await self._run_event_command(self.settings.timer.cancelled, timer_cancelled.id)
 
     async def trigger_timer_finished(self, timer_finished: TimerFinished) -> None:
         """Called when timer-finished event is received."""
-        await run_event_command(self.settings.timer.finished, timer_finished.id)
+        await self._run_event_command(self.settings.timer.finished, timer_finished.id)
         for _ in range(self.settings.timer.finished_wav_plays):
             await self._play_wav(
                 self.settings.timer.finished_wav,
@@ -1014,8 +1170,8 @@ class AlwaysStreamingSatellite(SatelliteBase):
             # Debug audio recording
             if self.stt_audio_writer is not None:
                 if audio_bytes is None:
-                    chunk = AudioChunk.from_event(event)
-                    audio_bytes = chunk.audio
+                    # Raw PCM is the event payload
+                    audio_bytes = event.payload or bytes()
 
                 self.stt_audio_writer.write(audio_bytes)
 
@@ -1041,12 +1197,12 @@ class VadStreamingSatellite(SatelliteBase):
         self.timeout_seconds: Optional[float] = None
 
         # Audio from right before speech starts (circular buffer)
-        self.vad_buffer: Optional[RingBuffer] = None
+        self.vad_buffer: Optional[AudioRingBuffer] = None
 
         if settings.vad.buffer_seconds > 0:
             # Assume 16Khz, 16-bit mono samples
             vad_buffer_bytes = int(math.ceil(settings.vad.buffer_seconds * 16000 * 2))
-            self.vad_buffer = RingBuffer(maxlen=vad_buffer_bytes)
+            self.vad_buffer = AudioRingBuffer(maxlen=vad_buffer_bytes)
 
         if settings.wake.enabled:
             _LOGGER.warning("Local wake word detection is enabled but will not be used")
@@ -1088,16 +1244,12 @@ class VadStreamingSatellite(SatelliteBase):
         ):
             return
 
-        # Only unpack chunk once
-        chunk: Optional[AudioChunk] = None
+        if audio_bytes is None:
+            # Raw PCM is the event payload
+            audio_bytes = event.payload or bytes()
 
         # Debug audio recording
         if self.stt_audio_writer is not None:
-            if audio_bytes is None:
-                # Need to unpack
-                chunk = AudioChunk.from_event(event)
-                audio_bytes = chunk.audio
-
             self.stt_audio_writer.write(audio_bytes)
 
         if (
@@ -1121,13 +1273,6 @@ class VadStreamingSatellite(SatelliteBase):
 
         if not self.is_streaming:
             # Check VAD
-            if audio_bytes is None:
-                if chunk is None:
-                    # Need to unpack
-                    chunk = AudioChunk.from_event(event)
-
-                audio_bytes = chunk.audio
-
             if not self.vad(audio_bytes):
                 # No speech
                 if self.vad_buffer is not None:
@@ -1154,9 +1299,7 @@ class VadStreamingSatellite(SatelliteBase):
             if self.vad_buffer is not None:
                 # Send contents of VAD buffer first. This is the audio that was
                 # recorded right before speech was detected.
-                if chunk is None:
-                    chunk = AudioChunk.from_event(event)
-
+                chunk = AudioChunk.from_event(event)
                 await self.event_to_server(
                     AudioChunk(
                         rate=chunk.rate,
@@ -1174,11 +1317,11 @@ class VadStreamingSatellite(SatelliteBase):
 
     def _reset_vad(self):
         """Reset state of VAD."""
-        self.vad(None)
+        self.vad.reset()
 
         if self.vad_buffer is not None:
             # Clear buffer
-            self.vad_buffer.put(bytes(self.vad_buffer.maxlen))
+            self.vad_buffer.fill_silence()
 
 
 # -----------------------------------------------------------------------------
@@ -1287,8 +1430,8 @@ class WakeStreamingSatellite(SatelliteBase):
         # Debug audio recording
         if (self.wake_audio_writer is not None) or (self.stt_audio_writer is not None):
             if audio_bytes is None:
-                chunk = AudioChunk.from_event(event)
-                audio_bytes = chunk.audio
+                # Raw PCM is the event payload
+                audio_bytes = event.payload or bytes()
 
             if self.wake_audio_writer is not None:
                 self.wake_audio_writer.write(audio_bytes)
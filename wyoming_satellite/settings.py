@@ -172,6 +172,32 @@ class EventSettings(ServiceSettings):
     connected: Optional[List[str]] = None
     disconnected: Optional[List[str]] = None
 
+    persistent_commands: bool = False
+    """Keep event commands running and send them one line of input per event."""
+
+    @property
+    def has_commands(self) -> bool:
+        """True if any event command is set."""
+        return any(
+            (
+                self.startup,
+                self.streaming_start,
+                self.streaming_stop,
+                self.detect,
+                self.detection,
+                self.played,
+                self.transcript,
+                self.stt_start,
+                self.stt_stop,
+                self.synthesize,
+                self.tts_start,
+                self.tts_stop,
+                self.error,
+                self.connected,
+                self.disconnected,
+            )
+        )
+
 
 @dataclass(frozen=True)
 class TimerSettings:
@@ -198,6 +224,11 @@ class TimerSettings:
     finished_wav_delay: float = 0
     """Delay in seconds between repeats of finished WAV."""
 
+    @property
+    def has_commands(self) -> bool:
+        """True if any timer command is set."""
+        return any((self.started, self.updated, self.cancelled, self.finished))
+
 
 @dataclass(frozen=True)
 class SatelliteSettings:
@@ -1,12 +1,16 @@
 """Utility methods."""
 from .audio import (
     AudioBuffer,
+    AudioRingBuffer,
     DebugAudioWriter,
     chunk_samples,
+    coalesce_audio_events,
     multiply_volume,
+    read_wav,
     wav_to_events,
 )
 from .misc import (
+    PersistentEventCommands,
     get_mac_address,
     needs_silero,
     needs_webrtc,
@@ -17,13 +21,17 @@ from .misc import (
 
 __all__ = [
     "AudioBuffer",
+    "AudioRingBuffer",
     "chunk_samples",
+    "coalesce_audio_events",
     "DebugAudioWriter",
     "get_mac_address",
     "multiply_volume",
     "needs_silero",
     "needs_webrtc",
     "normalize_wake_word",
+    "PersistentEventCommands",
+    "read_wav",
     "run_event_command",
     "split_command",
     "wav_to_events",
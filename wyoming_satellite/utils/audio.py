@@ -1,10 +1,12 @@
 """Audio utilities."""
 import array
 import logging
+import os
 import time
 import wave
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Iterator, Optional, Union
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
 
 from pyring_buffer import RingBuffer
 from wyoming.audio import AudioChunk, AudioStart, AudioStop
@@ -12,6 +14,8 @@ from wyoming.event import Event
 
 _LOGGER = logging.getLogger()
 
+_AUDIO_FORMAT_KEYS = ("rate", "width", "channels")
+
 
 class AudioBuffer:
     """Fixed-sized audio buffer with variable internal length."""
@@ -52,8 +56,72 @@ class AudioBuffer:
         return self._length > 0
 
 
+class AudioRingBuffer:
+    """Fixed-sized circular audio buffer that keeps the most recent bytes."""
+
+    def __init__(self, maxlen: int) -> None:
+        """Initialize empty buffer."""
+        self._buffer = bytearray(maxlen)
+        self._pos = 0
+        self._length = 0
+
+        # Copied in by fill_silence, so resets don't allocate
+        self._silence = bytes(maxlen)
+
+    @property
+    def maxlen(self) -> int:
+        """Get the maximum number of bytes held by the buffer."""
+        return len(self._buffer)
+
+    def put(self, data: bytes) -> None:
+        """Write bytes at the current position, wrapping around if needed."""
+        maxlen = len(self._buffer)
+        view = memoryview(data)
+        if len(view) >= maxlen:
+            # Only the most recent bytes fit
+            self._buffer[:] = view[-maxlen:]
+            self._pos = 0
+            self._length = maxlen
+            return
+
+        new_pos = self._pos + len(view)
+        if new_pos >= maxlen:
+            # Split into two spans
+            num_bytes_1 = maxlen - self._pos
+            self._buffer[self._pos :] = view[:num_bytes_1]
+            new_pos -= maxlen
+            self._buffer[:new_pos] = view[num_bytes_1:]
+        else:
+            self._buffer[self._pos : new_pos] = view
+
+        self._pos = new_pos
+        self._length = min(maxlen, self._length + len(view))
+
+    def getvalue(self) -> bytes:
+        """Get buffered bytes, oldest first."""
+        view = memoryview(self._buffer)
+        if self._length < len(self._buffer):
+            # Not wrapped yet
+            return bytes(view[: self._length])
+
+        return b"".join((view[self._pos :], view[: self._pos]))
+
+    def fill_silence(self) -> None:
+        """Fill the whole buffer with zeros without allocating."""
+        self._buffer[:] = self._silence
+        self._length = len(self._buffer)
+
+    def __len__(self) -> int:
+        """Get the number of bytes currently in the buffer."""
+        return self._length
+
+
 def multiply_volume(chunk: bytes, volume_multiplier: float) -> bytes:
     """Multiplies 16-bit PCM samples by a constant."""
+    np = _numpy()
+    if np is not None:
+        samples = np.frombuffer(chunk, dtype="<i2") * volume_multiplier
+        return np.clip(samples, -32768, 32767).astype("<i2").tobytes()
 
     def _clamp(val: float) -> float:
         """Clamp to signed 16-bit."""
@@ -65,6 +133,20 @@ def multiply_volume(chunk: bytes, volume_multiplier: float) -> bytes:
     ).tobytes()
 
 
+@lru_cache(maxsize=1)
+def _numpy() -> Optional[Any]:
+    """Import numpy on first use, since it is slow to load at startup.
+
+    numpy is optional (installed with the silerovad extra).
+    """
+    try:
+        import numpy
+
+        return numpy
+    except ImportError:
+        return None
+
+
 def chunk_samples(
     samples: bytes,
     bytes_per_chunk: int,
@@ -99,39 +181,96 @@ def chunk_samples(
         leftover_chunk_buffer.append(rest_samples)
 
 
+def coalesce_audio_events(events: Iterable[Event]) -> Iterator[Event]:
+    """Merge runs of audio chunks with the same format into single events."""
+    run: List[Event] = []
+
+    def _flush() -> Iterator[Event]:
+        if len(run) == 1:
+            yield run[0]
+        elif run:
+            # Header (and timestamp) of the first chunk is kept
+            yield Event(
+                type=run[0].type,
+                data=run[0].data,
+                payload=b"".join(e.payload or bytes() for e in run),
+            )
+
+        run.clear()
+
+    for event in events:
+        if AudioChunk.is_type(event.type):
+            if run and (not _same_format(run[0], event)):
+                yield from _flush()
+
+            run.append(event)
+            continue
+
+        yield from _flush()
+        yield event
+
+    yield from _flush()
+
+
+def _same_format(event_1: Event, event_2: Event) -> bool:
+    """True if both audio chunk events have the same rate/width/channels."""
+    data_1 = event_1.data or {}
+    data_2 = event_2.data or {}
+    return all(data_1.get(key) == data_2.get(key) for key in _AUDIO_FORMAT_KEYS)
+
+
+def read_wav(wav_path: Union[str, Path]) -> Tuple[int, int, int, bytes]:
+    """Read a WAV file as (rate, width, channels, audio).
+
+    Results are cached until the file is modified.
+    """
+    wav_path = str(wav_path)
+    return _read_wav(wav_path, os.stat(wav_path).st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _read_wav(wav_path: str, mtime_ns: int) -> Tuple[int, int, int, bytes]:
+    with wave.open(wav_path, "rb") as wav_file:
+        return (
+            wav_file.getframerate(),
+            wav_file.getsampwidth(),
+            wav_file.getnchannels(),
+            wav_file.readframes(wav_file.getnframes()),
+        )
+
+
 def wav_to_events(
     wav_path: Union[str, Path],
     samples_per_chunk: int = 1024,
     volume_multiplier: float = 1.0,
 ) -> Iterator[Event]:
     """Load WAV audio for playback on an event (wake/done)."""
-    with wave.open(str(wav_path), "rb") as wav_file:
-        rate = wav_file.getframerate()
-        width = wav_file.getsampwidth()
-        channels = wav_file.getnchannels()
-
-        timestamp = 0
-        yield AudioStart(
-            rate=rate, width=width, channels=channels, timestamp=timestamp
-        ).event()
-
-        audio_bytes = wav_file.readframes(samples_per_chunk)
-        while audio_bytes:
-            if volume_multiplier != 1.0:
-                audio_bytes = multiply_volume(audio_bytes, volume_multiplier)
-
-            chunk = AudioChunk(
-                rate=rate,
-                width=width,
-                channels=channels,
-                audio=audio_bytes,
-                timestamp=timestamp,
-            )
-            yield chunk.event()
-            timestamp += int(chunk.seconds * 1000)
-            audio_bytes = wav_file.readframes(samples_per_chunk)
-
-        yield AudioStop(timestamp=timestamp).event()
+    rate, width, channels, audio = read_wav(wav_path)
+    if volume_multiplier != 1.0:
+        # Adjust all samples at once instead of per chunk
+        audio = multiply_volume(audio, volume_multiplier)
+
+    audio_view = memoryview(audio)
+    bytes_per_chunk = samples_per_chunk * width * channels
+
+    timestamp = 0
+    yield AudioStart(
+        rate=rate, width=width, channels=channels, timestamp=timestamp
+    ).event()
+
+    for chunk_start in range(0, len(audio), bytes_per_chunk):
+        audio_bytes = bytes(audio_view[chunk_start : chunk_start + bytes_per_chunk])
+        chunk = AudioChunk(
+            rate=rate,
+            width=width,
+            channels=channels,
+            audio=audio_bytes,
+            timestamp=timestamp,
+        )
+        yield chunk.event()
+        timestamp += int(chunk.seconds * 1000)
+
+    yield AudioStop(timestamp=timestamp).event()
 
 
 class DebugAudioWriter:
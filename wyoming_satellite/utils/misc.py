@@ -6,14 +6,16 @@ import logging
 import re
 import shlex
 import unicodedata
-import uuid
 from functools import lru_cache
-from typing import List, Optional, Union
+from typing import Dict, Final, List, Optional, Tuple, Union
 
 from wyoming.event import Eventable
 
 _LOGGER = logging.getLogger()
 
+# Seconds to wait for a persistent event command to exit
+_CLOSE_TIMEOUT: Final = 5
+
 
 async def run_event_command(
     command: Optional[List[str]], command_input: Optional[Union[str, Eventable]] = None
@@ -22,10 +24,7 @@ async def run_event_command(
     if not command:
         return
 
-    if isinstance(command_input, Eventable):
-        # Convert event to JSON
-        event_dict = command_input.event().to_dict()
-        command_input = json.dumps(event_dict, ensure_ascii=False)
+    command_input = _event_command_input(command_input)
 
     _LOGGER.debug("Running %s", command)
     program, *program_args = command
@@ -41,14 +40,101 @@ async def run_event_command(
         await proc.wait()
 
 
+class PersistentEventCommands:
+    """Keeps event commands running, sending one line of input per event."""
+
+    def __init__(self) -> None:
+        self._procs: Dict[Tuple[str, ...], asyncio.subprocess.Process] = {}
+
+    async def run(
+        self,
+        command: Optional[List[str]],
+        command_input: Optional[Union[str, Eventable]] = None,
+    ) -> None:
+        """Send input to a command, starting it if it's not running."""
+        if not command:
+            return
+
+        # Input is sent as a single line (empty if there is no input)
+        command_input = _event_command_input(command_input) or ""
+        line = " ".join(command_input.splitlines()) + "\n"
+
+        command_key = tuple(command)
+        proc = self._procs.get(command_key)
+        if (proc is None) or (proc.returncode is not None):
+            _LOGGER.debug("Starting %s", command)
+            program, *program_args = command
+            proc = await asyncio.create_subprocess_exec(
+                program, *program_args, stdin=asyncio.subprocess.PIPE
+            )
+            self._procs[command_key] = proc
+
+        assert proc.stdin is not None
+
+        try:
+            proc.stdin.write(line.encode("utf-8"))
+            await proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            _LOGGER.warning("Event command exited: %s", command)
+            self._procs.pop(command_key, None)
+
+    async def close(self, timeout: float = _CLOSE_TIMEOUT) -> None:
+        """Close stdin of all commands and wait for them to exit.
+
+        Commands that don't exit within timeout are terminated, then killed.
+        """
+        procs = list(self._procs.values())
+        self._procs.clear()
+
+        for proc in procs:
+            if proc.stdin is not None:
+                proc.stdin.close()
+
+        await asyncio.gather(*(_wait_or_kill(proc, timeout) for proc in procs))
+
+
+async def _wait_or_kill(proc: asyncio.subprocess.Process, timeout: float) -> None:
+    """Wait for a process to exit, terminating or killing it after timeout."""
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=timeout)
+        return
+    except asyncio.TimeoutError:
+        _LOGGER.warning("Event command did not exit, terminating: %s", proc.pid)
+
+    try:
+        proc.terminate()
+        await asyncio.wait_for(proc.wait(), timeout=timeout)
+        return
+    except ProcessLookupError:
+        # Already exited
+        return
+    except asyncio.TimeoutError:
+        _LOGGER.warning("Event command did not terminate, killing: %s", proc.pid)
+
+    try:
+        proc.kill()
+    except ProcessLookupError:
+        return
+
+    await proc.wait()
+
+
+def _event_command_input(
+    command_input: Optional[Union[str, Eventable]]
+) -> Optional[str]:
+    """Convert events to JSON for event command input."""
+    if isinstance(command_input, Eventable):
+        event_dict = command_input.event().to_dict()
+        return json.dumps(event_dict, ensure_ascii=False)
+
+    return command_input
+
+
 def get_mac_address() -> str:
     """Return MAC address formatted as hex with no colons."""
-    return "".join(
-        # pylint: disable=consider-using-f-string
-        ["{:02x}".format((uuid.getnode() >> ele) & 0xFF) for ele in range(0, 8 * 6, 8)][
-            ::-1
-        ]
-    )
+    import uuid
+
+    return f"{uuid.getnode():012x}"
 
 
 def needs_webrtc(args: argparse.Namespace) -> bool:
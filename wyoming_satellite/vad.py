@@ -1,5 +1,4 @@
 """Voice activity detection."""
-from typing import Optional
 
 
 class SileroVad:
@@ -13,13 +12,12 @@ class SileroVad:
         self.trigger_level = trigger_level
         self._activation = 0
 
-    def __call__(self, audio_bytes: Optional[bytes]) -> bool:
-        if audio_bytes is None:
-            # Reset
-            self._activation = 0
-            self.detector.reset()
-            return False
+    def reset(self) -> None:
+        """Reset detector and activation state."""
+        self._activation = 0
+        self.detector.reset()
 
+    def __call__(self, audio_bytes: bytes) -> bool:
         if self.detector(audio_bytes) >= self.threshold:
             # Speech detected
             self._activation += 1
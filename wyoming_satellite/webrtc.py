@@ -18,11 +18,9 @@ class WebRtcAudio:
 
     def __call__(self, audio_bytes: bytes) -> bytes:
         """Process in 10ms chunks."""
-        clean_chunk = bytes()
-        for sub_chunk in chunk_samples(
-            audio_bytes, self._sub_chunk_bytes, self.audio_buffer
-        ):
-            result = self.audio_processor.Process10ms(sub_chunk)
-            clean_chunk += result.audio
-
-        return clean_chunk
+        return b"".join(
+            self.audio_processor.Process10ms(sub_chunk).audio
+            for sub_chunk in chunk_samples(
+                audio_bytes, self._sub_chunk_bytes, self.audio_buffer
+            )
+        )